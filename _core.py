@@ -9,19 +9,30 @@ from .capture.frame_capture import FrameCapture
 
 def record(output_path: str | Path, codec: str = "libx264", crf: int = 24,
            start_frame: int | None = None, end_frame: int | None = None,
-           width: int | None = None, height: int | None = None,):
+           width: int | None = None, height: int | None = None,
+           incremental: bool = False, offscreen: bool = False,
+           preview_after: int | None = None):
     
-    io_utils.check_directory(output_path, build=True)
+    if not io_utils.is_stream_url(output_path):
+        io_utils.check_directory(output_path, build=True)
     config = CaptureConfig(output_path=output_path,
                            codec=codec,
                            crf=crf,
                            start_frame=start_frame,
                            end_frame=end_frame,
                            width=width,
-                           height=height)
+                           height=height,
+                           incremental=incremental,
+                           offscreen=offscreen,
+                           progressive=preview_after is not None,
+                           preview_after=preview_after)
 
     capture = FrameCapture(config)
-    capture.on_capture_complete.register(launchers.open_player)
+    if preview_after:
+        capture.on_preview_ready.register(launchers.open_player)
+    # A finished stream has nothing left to play.
+    elif not io_utils.is_stream_url(output_path):
+        capture.on_capture_complete.register(launchers.open_player)
     capture.run()
 
 
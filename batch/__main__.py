@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import argparse
+import sys
+
+from .job_queue import JobQueue, JobStatus
+from .orchestrator import default_workers, render_parallel
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="maya_playblast.batch", description="Batch playblast tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render = commands.add_parser("render", help="Render one shot across several mayapy workers.")
+    render.add_argument("--scene",   type=str, required=True, help="Maya scene path (.ma / .mb)")
+    render.add_argument("--output",  type=str, required=True, help="Output video path")
+    render.add_argument("--start",   type=int, required=True, help="Start frame")
+    render.add_argument("--end",     type=int, required=True, help="End frame")
+    render.add_argument("--camera",  type=str, default="persp", help="Camera to render")
+    render.add_argument("--width",   type=int, default=960, help="Width in pixels")
+    render.add_argument("--height",  type=int, default=540, help="Height in pixels")
+    render.add_argument("--workers", type=int, default=default_workers(), help="Number of mayapy workers")
+    render.add_argument("--keep-segments", action="store_true", help="Keep intermediate segments")
+
+    queue = commands.add_parser("queue", help="Run a JSON list of playblast jobs on a worker pool.")
+    queue.add_argument("jobs",       type=str, help="JSON file with a list of jobs (or {\"jobs\": [...]})")
+    queue.add_argument("--workers",  type=int, default=default_workers(), help="Number of mayapy workers")
+    queue.add_argument("--retries",  type=int, default=1, help="Retries per failed job")
+    queue.add_argument("--manifest", type=str, default=None, help="JSON manifest of job results")
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+
+    if args.command == "render":
+        render_parallel(args.scene, args.output, args.start, args.end,
+                        workers=args.workers, camera=args.camera,
+                        width=args.width, height=args.height,
+                        keep_segments=args.keep_segments)
+    elif args.command == "queue":
+        manifest = args.manifest or str(Path(args.jobs).with_suffix(".manifest.json"))
+        job_queue = JobQueue.from_file(args.jobs, workers=args.workers,
+                                       retries=args.retries, manifest_path=manifest)
+        jobs = job_queue.run()
+        if any(x.status == JobStatus.FAILED for x in jobs):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+import json
+import time
+
+from ..core import signal
+from ..core.logger import log
+from ..io import io_utils, launchers
+from .orchestrator import WORKER_SCRIPT, default_workers
+
+
+class JobStatus(str, Enum):
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class PlayblastJob:
+
+    scene_path: str
+    output_path: str
+    camera: str = "persp"
+    start_frame: int | None = None
+    end_frame: int | None = None
+    width: int = 960
+    height: int = 540
+    # CaptureConfig overrides, e.g. {"codec": "libx265", "crf": 18}
+    overrides: dict = field(default_factory=dict)
+
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0
+    duration: float = 0.0
+    result_path: str | None = None
+    error: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PlayblastJob:
+        names = {x.name for x in fields(cls)}
+        unknown = set(data) - names
+        if unknown:
+            raise ValueError(f"Unknown job keys: {', '.join(sorted(unknown))}")
+        job = cls(**data)
+        job.status = JobStatus(job.status)
+
+        return job
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["status"] = self.status.value
+
+        return data
+
+    def worker_args(self, result_path: Path) -> list[str]:
+        args = ["--scene", str(self.scene_path),
+                "--output", str(self.output_path),
+                "--camera", self.camera,
+                "--width", str(self.width),
+                "--height", str(self.height),
+                "--config", json.dumps(self.overrides),
+                "--result", str(result_path)]
+        if self.start_frame is not None:
+            args += ["--start", str(self.start_frame)]
+        if self.end_frame is not None:
+            args += ["--end", str(self.end_frame)]
+
+        return args
+
+
+class JobQueue:
+
+    def __init__(self, workers: int | None = None, retries: int = 1,
+                 manifest_path: str | Path | None = None):
+        self._workers = workers or default_workers()
+        self._retries = max(0, retries)
+        self._manifest_path = Path(manifest_path) if manifest_path else None
+        self._jobs: list[PlayblastJob] = []
+        self._lock = Lock()
+        # Emitted from worker threads with the updated job.
+        self.on_job_updated = signal.Signal()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def jobs(self) -> list[PlayblastJob]:
+        return list(self._jobs)
+
+    @classmethod
+    def from_file(cls, path: str | Path, **kwargs) -> JobQueue:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        jobs = data["jobs"] if isinstance(data, dict) else data
+
+        queue = cls(**kwargs)
+        for job_data in jobs:
+            queue.submit(PlayblastJob.from_dict(job_data))
+
+        return queue
+
+    def submit(self, job: PlayblastJob) -> PlayblastJob:
+        self._jobs.append(job)
+        return job
+
+    def run(self) -> list[PlayblastJob]:
+        pending = [x for x in self._jobs if x.status != JobStatus.DONE]
+        log.debug(f"Run {len(pending)} playblast jobs on {self._workers} workers.")
+
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="PlayblastJob") as executor:
+            list(executor.map(self._run_job, pending))
+
+        failed = [x for x in self._jobs if x.status == JobStatus.FAILED]
+        log.debug(f"Jobs complete — {len(self._jobs) - len(failed)} done, {len(failed)} failed.")
+
+        return self.jobs
+
+    def write_manifest(self, path: str | Path | None = None) -> Path | None:
+        path = Path(path) if path else self._manifest_path
+        if path is None:
+            return None
+
+        io_utils.check_directory(path, build=True)
+        with self._lock:
+            data = {"updated": datetime.now().isoformat(timespec="seconds"),
+                    "jobs": [x.to_dict() for x in self._jobs]}
+            path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+
+        return path
+
+    def _run_job(self, job: PlayblastJob) -> PlayblastJob:
+        io_utils.check_directory(job.output_path, build=True)
+        output_path = Path(job.output_path)
+        result_path = output_path.with_name(f".{output_path.stem}_result.json")
+        log_path = output_path.with_name(f"{output_path.stem}.log")
+
+        while job.attempts <= self._retries:
+            job.attempts += 1
+            self._update(job, JobStatus.RUNNING)
+
+            start_time = time.perf_counter()
+            try:
+                proc = launchers.mayapy_script(WORKER_SCRIPT, job.worker_args(result_path), log_path)
+                return_code = proc.wait()
+                job.duration = time.perf_counter() - start_time
+                if return_code == 0 and result_path.exists():
+                    job.result_path = json.loads(result_path.read_text(encoding="utf-8"))["output_path"]
+                    job.error = None
+                    self._update(job, JobStatus.DONE)
+                    break
+                job.error = f"Worker exited with code {return_code}, see {log_path}"
+            except Exception as e:
+                job.duration = time.perf_counter() - start_time
+                job.error = str(e)
+            finally:
+                result_path.unlink(missing_ok=True)
+
+            log.warning(f"Job {job.scene_path} [{job.camera}] attempt {job.attempts} failed — {job.error}")
+            self._update(job, JobStatus.FAILED)
+
+        return job
+
+    def _update(self, job: PlayblastJob, status: JobStatus) -> None:
+        with self._lock:
+            job.status = status
+        self.write_manifest()
+        self.on_job_updated.emit(job)
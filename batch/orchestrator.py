@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from ..core.logger import log
+from ..io import io_utils, launchers
+
+
+WORKER_SCRIPT = Path(__file__).parent / "worker.py"
+
+
+@dataclass
+class Segment:
+
+    index: int
+    start_frame: int
+    end_frame: int
+    output_path: Path
+
+    @property
+    def log_path(self) -> Path:
+        return self.output_path.with_suffix(".log")
+
+    @property
+    def frame_count(self) -> int:
+        return self.end_frame - self.start_frame + 1
+
+
+def default_workers() -> int:
+    # Each mayapy and its ffmpeg are multi-threaded, leave them some cores.
+    return max(1, (os.cpu_count() or 1) // 4)
+
+
+def split_range(start_frame: int, end_frame: int, chunks: int) -> list[tuple[int, int]]:
+    frame_count = end_frame - start_frame + 1
+    if frame_count < 1:
+        raise ValueError(f"Invalid frame range [{start_frame} → {end_frame}]")
+    chunks = max(1, min(chunks, frame_count))
+
+    size, remainder = divmod(frame_count, chunks)
+    ranges = []
+    current = start_frame
+    for i in range(chunks):
+        count = size + (1 if i < remainder else 0)
+        ranges.append((current, current + count - 1))
+        current += count
+
+    return ranges
+
+
+def render_parallel(scene_path: str | Path, output_path: str | Path,
+                    start_frame: int, end_frame: int,
+                    workers: int | None = None, camera: str = "persp",
+                    width: int = 960, height: int = 540,
+                    config_overrides: dict | None = None,
+                    keep_segments: bool = False) -> Path:
+
+    output_path = Path(output_path)
+    io_utils.check_directory(output_path, build=True)
+    if output_path.exists():
+        output_path = io_utils.increment_file_path(output_path)
+
+    workers = workers or default_workers()
+    segment_dir = Path(tempfile.mkdtemp(prefix=f".{output_path.stem}_", dir=output_path.parent))
+    segments = [Segment(i, start, end, segment_dir / f"segment_{i:04d}{output_path.suffix}")
+                for i, (start, end) in enumerate(split_range(start_frame, end_frame, workers))]
+
+    log.debug(f"Parallel capture — frames [{start_frame} → {end_frame}] "
+              f"across {len(segments)} workers into {output_path}")
+
+    start_time = time.perf_counter()
+    procs = []
+    for segment in segments:
+        args = ["--scene", str(scene_path),
+                "--output", str(segment.output_path),
+                "--start", str(segment.start_frame),
+                "--end", str(segment.end_frame),
+                "--camera", camera,
+                "--width", str(width),
+                "--height", str(height),
+                "--config", json.dumps(config_overrides or {})]
+        procs.append(launchers.mayapy_script(WORKER_SCRIPT, args, segment.log_path))
+
+    failed = []
+    for segment, proc in zip(segments, procs):
+        if proc.wait() != 0 or not segment.output_path.exists():
+            failed.append(segment)
+
+    if failed:
+        details = "\n\t".join(f"[{x.start_frame} → {x.end_frame}] see {x.log_path}" for x in failed)
+        raise RuntimeError(f"{len(failed)} segment(s) failed !\n\t{details}")
+
+    launchers.ffmpeg_concat([x.output_path for x in segments], output_path)
+    if not keep_segments:
+        shutil.rmtree(segment_dir, ignore_errors=True)
+
+    log.debug(f"Parallel capture complete in {time.perf_counter() - start_time:.1f}s — {output_path}")
+
+    return output_path
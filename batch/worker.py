@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import argparse
+import json
+import signal
+import sys
+import traceback
+
+_ROOT_PATH = Path(__file__)
+_MODULE_PARENT_PATH = _ROOT_PATH.parent.parent.parent
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Render a frame range of a scene with mayapy.")
+    parser.add_argument("--scene",   type=str, required=True, help="Maya scene path (.ma / .mb)")
+    parser.add_argument("--output",  type=str, required=True, help="Output video path")
+    parser.add_argument("--start",   type=int, default=None, help="Start frame")
+    parser.add_argument("--end",     type=int, default=None, help="End frame")
+    parser.add_argument("--camera",  type=str, default="persp", help="Camera to render")
+    parser.add_argument("--width",   type=int, default=960, help="Width in pixels")
+    parser.add_argument("--height",  type=int, default=540, help="Height in pixels")
+    parser.add_argument("--config",  type=str, default="{}", help="CaptureConfig overrides as JSON")
+    parser.add_argument("--result",  type=str, default=None, help="JSON file receiving the final output path")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+
+    from maya import standalone as maya_standalone
+    maya_standalone.initialize()
+
+    from maya import cmds
+
+    sys.path.insert(0, str(_MODULE_PARENT_PATH))
+    from maya_playblast.capture.backends.maya.ogs_render import OgsRenderBackend
+    from maya_playblast.capture.backends.resolver import resolve_backend_forced
+    from maya_playblast.capture.config import CaptureConfig, ViewConfig
+    from maya_playblast.capture.frame_capture import FrameCapture
+    from maya_playblast.core.cancellation import CancellationToken
+
+    print(f"[INFO] Open scene : {args.scene}")
+    cmds.file(args.scene, open=True, force=True)
+
+    capture_config = CaptureConfig(output_path=args.output,
+                                   start_frame=args.start,
+                                   end_frame=args.end,
+                                   width=args.width,
+                                   height=args.height,
+                                   **json.loads(args.config))
+    view_config = ViewConfig(view=None, width=args.width, height=args.height, camera=args.camera)
+    backend = resolve_backend_forced(OgsRenderBackend, view_config)
+
+    completed = []
+    def on_complete(path):
+        completed.append(path)
+
+    # Farm preemption sends SIGTERM, stop between frames so checkpointed segments survive.
+    token = CancellationToken()
+    signal.signal(signal.SIGTERM, lambda *_: token.cancel())
+    if hasattr(signal, "SIGBREAK"):
+        signal.signal(signal.SIGBREAK, lambda *_: token.cancel())
+
+    capture = FrameCapture(capture_config, view_config, backend, token=token)
+    capture.on_capture_complete.register(on_complete)
+    capture.run()
+
+    maya_standalone.uninitialize()
+    if token.cancelled:
+        print(f"[WARNING] Capture cancelled, run again to resume : {args.output}")
+        return 1
+    if not completed:
+        print(f"[ERROR] Capture failed : {args.output}")
+        return 1
+
+    if args.result:
+        Path(args.result).write_text(json.dumps({"output_path": str(completed[0])}), encoding="utf-8")
+    print(f"[SUCCESS] Capture complete : {completed[0]}")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except Exception as exc:
+        print(f"\n[ERROR] {exc}")
+        traceback.print_exc()
+        sys.exit(1)
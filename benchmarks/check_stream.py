@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import argparse
+import logging
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from run_benchmarks import Scene, QtCore, frames, omui, _load_package
+
+
+PROTOCOLS = ["tcp", "udp", "http"]
+# Localhost UDP may still drop a datagram under load.
+MIN_RECEIVED = {"udp": 0.9}
+_FRAME_LINE = re.compile(r"frame=\s*(\d+)")
+
+
+def _free_port(kind: int) -> int:
+    with socket.socket(socket.AF_INET, kind) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _count_frames(ffmpeg_path: str, path: Path) -> int:
+    result = subprocess.run([ffmpeg_path, "-hide_banner", "-i", str(path), "-map", "0:v", "-f", "null", "-"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60)
+    counts = _FRAME_LINE.findall(result.stderr.decode(errors="replace"))
+    return int(counts[-1]) if counts else 0
+
+
+def check_protocol(ffmpeg_path: str, protocol: str, width: int, height: int, frame_count: int) -> bool:
+    from maya_playblast.capture.config import CaptureConfig, ViewConfig
+    from maya_playblast.capture.backends.maya.view import ViewBackend
+    from maya_playblast.capture.frame_capture import FrameCapture
+    from maya_playblast.io import launchers
+
+    port = _free_port(socket.SOCK_DGRAM if protocol == "udp" else socket.SOCK_STREAM)
+    url = f"{protocol}://127.0.0.1:{port}"
+    received_path = Scene.render_dir / f"stream_{protocol}.{'mp4' if protocol == 'http' else 'ts'}"
+    received_path.parent.mkdir(parents=True, exist_ok=True)
+    received_path.unlink(missing_ok=True)
+
+    receivers = []
+    def start_receiver():
+        receivers.append(launchers.stream_receiver(url, received_path))
+
+    # The receiver listens for udp/tcp, ffmpeg itself listens for http.
+    if protocol == "http":
+        timer = threading.Timer(1.0, start_receiver)
+        timer.start()
+    else:
+        start_receiver()
+        time.sleep(0.5)
+
+    config = CaptureConfig(output_path=url, codec="libx264", start_frame=0, end_frame=frame_count - 1,
+                           frame_rate=24, encoder="ffmpeg")
+    view_cfg = ViewConfig(view=omui.M3dView(width, height))
+    frames(width, height)
+    completed = []
+    def on_complete(path):
+        completed.append(path)
+
+    capture = FrameCapture(config, view_cfg, ViewBackend(view_cfg))
+    capture.on_capture_complete.register(on_complete)
+    capture.run()
+
+    if protocol == "http":
+        timer.join()
+    receiver = receivers[0]
+    try:
+        _, stderr = receiver.communicate(timeout=30)
+    except subprocess.TimeoutExpired:
+        receiver.kill()
+        _, stderr = receiver.communicate()
+
+    received = _count_frames(ffmpeg_path, received_path) if received_path.exists() else 0
+    expected = int(frame_count * MIN_RECEIVED.get(protocol, 1.0))
+    ok = bool(completed) and received >= expected
+    print(f"{url:<28} capture {'ok' if completed else 'failed'}, receiver code {receiver.returncode}, "
+          f"{received}/{frame_count} frames {'OK' if ok else 'FAILED'}")
+    if not ok and stderr:
+        print("\t" + stderr.decode(errors="replace").strip().replace("\n", "\n\t"))
+    received_path.unlink(missing_ok=True)
+
+    return ok
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Stream a fake Maya capture to a localhost receiver and count the frames.")
+    parser.add_argument("--protocols", nargs="+", default=PROTOCOLS, choices=PROTOCOLS)
+    parser.add_argument("--frames",    type=int, default=48, help="Frames streamed per protocol")
+    parser.add_argument("--width",     type=int, default=640)
+    parser.add_argument("--height",    type=int, default=360)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    ffmpeg_path = shutil.which("ffmpeg")
+    if not ffmpeg_path:
+        print("ffmpeg not found in PATH, stream round-trip skipped.")
+        return 0
+
+    _load_package()
+    logging.getLogger("Playblast").setLevel(logging.WARNING)
+    QtCore.QSettings._values["paths/ffmpeg"] = ffmpeg_path
+    QtCore.QSettings._values["paths/player"] = "player"
+
+    failures = [x for x in args.protocols if not check_protocol(ffmpeg_path, x, args.width, args.height, args.frames)]
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
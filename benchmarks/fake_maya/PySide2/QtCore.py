@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+
+class QSettings:
+
+    IniFormat = 1
+    _values: dict = {}
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def value(self, key: str, default=None):
+        return self._values.get(key, default)
+
+    def setValue(self, key: str, value) -> None:
+        self._values[key] = value
+
+    def sync(self) -> None:
+        pass
+
+
+class Signal:
+
+    def __init__(self, *args, **kwargs):
+        pass
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+
+class QWidget:
+
+    def __init__(self, *args, **kwargs):
+        self._parent = None
+
+    def parent(self):
+        return self._parent
+
+    def objectName(self) -> str:
+        return ""
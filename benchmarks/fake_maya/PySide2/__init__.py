@@ -0,0 +1 @@
+# Qt stand-in so the settings and UI helpers import without a display.
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from ._scene import PixelBuffer, Scene
+
+
+class MImage:
+
+    def __init__(self):
+        self._pixels = PixelBuffer()
+
+    def pixels(self) -> int:
+        return self._pixels.address
+
+
+class MTime:
+
+    kSeconds = 1
+    kFilm = 2
+
+    def __init__(self, value: float = 0.0, unit: int = kFilm):
+        self._value = value
+        self._unit = unit
+
+    @staticmethod
+    def uiUnit() -> int:
+        return MTime.kFilm
+
+    def asUnits(self, unit: int) -> float:
+        if self._unit == MTime.kSeconds and unit == MTime.kFilm:
+            return self._value * Scene.frame_rate
+        return self._value
+
+
+class MMessage:
+
+    @staticmethod
+    def removeCallback(callback_id: int) -> None:
+        return None
+
+
+class MUiMessage:
+
+    _next_id = 0
+
+    @classmethod
+    def addUiDeletedCallback(cls, name: str, callback, client_data=None) -> int:
+        cls._next_id += 1
+        return cls._next_id
+
+
+class MDagPath:
+
+    def __init__(self):
+        self._name = "|persp|perspShape"
+
+    def fullPathName(self) -> str:
+        return self._name
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from ._scene import Scene, frames
+
+
+class M3dView:
+
+    def __init__(self, width: int = 960, height: int = 540):
+        self._width = width
+        self._height = height
+
+    @classmethod
+    def active3dView(cls) -> M3dView:
+        return cls()
+
+    @staticmethod
+    def getM3dViewFromModelPanel(panel: str, view: M3dView) -> None:
+        return None
+
+    def portWidth(self) -> int:
+        return self._width
+
+    def portHeight(self) -> int:
+        return self._height
+
+    def readColorBuffer(self, image, rgba: bool = True) -> None:
+        # Maya returns rows bottom-up, the synthetic frames are left as is.
+        image._pixels.fill(frames(self._width, self._height).get(Scene.current_time))
+
+    def refresh(self, all_views: bool = False, force: bool = False) -> None:
+        return None
+
+    def widget(self) -> int:
+        return 1
+
+    def getCamera(self, path) -> None:
+        return None
+
+
+class MQtUtil:
+
+    @staticmethod
+    def mainWindow() -> int:
+        return 1
+
+    @staticmethod
+    def findControl(name: str) -> int:
+        return 1 if name == Scene.panel else 0
+
+    @staticmethod
+    def findWindow(name: str) -> int:
+        return 0
@@ -0,0 +1 @@
+# Minimal stand-in for the Maya Python API, only what the capture pipeline touches.
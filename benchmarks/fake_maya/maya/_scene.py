@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import ctypes
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+
+class Scene:
+
+    start_frame = 1
+    end_frame = 100
+    frame_rate = 24
+    current_time = 1.0
+    batch = False
+    panel = "modelPanel4"
+    render_dir = Path(tempfile.gettempdir()) / "maya_playblast_bench"
+
+
+class SyntheticFrames:
+
+    VARIANTS = 8
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        y, x = np.mgrid[0:height, 0:width]
+        frames = []
+        for i in range(self.VARIANTS):
+            frame = np.empty((height, width, 4), dtype=np.uint8)
+            frame[..., 0] = (x * 255 // max(width - 1, 1) + i * 16) % 256
+            frame[..., 1] = (y * 255 // max(height - 1, 1) + i * 8) % 256
+            frame[..., 2] = ((x + y + i * 32) // 4) % 256
+            frame[..., 3] = 255
+            frames.append(frame)
+        self._frames = frames
+
+    def get(self, frame: float) -> np.ndarray:
+        return self._frames[int(frame) % self.VARIANTS]
+
+
+_generators: dict[tuple[int, int], SyntheticFrames] = {}
+
+
+def frames(width: int, height: int) -> SyntheticFrames:
+    key = (width, height)
+    if key not in _generators:
+        _generators[key] = SyntheticFrames(width, height)
+    return _generators[key]
+
+
+class PixelBuffer:
+
+    def __init__(self):
+        self._buffer = None
+        self.width = 0
+        self.height = 0
+
+    def fill(self, array: np.ndarray) -> None:
+        height, width = array.shape[:2]
+        if self._buffer is None or (width, height) != (self.width, self.height):
+            self._buffer = (ctypes.c_uint8 * array.nbytes)()
+            self.width, self.height = width, height
+        ctypes.memmove(self._buffer, array.ctypes.data, array.nbytes)
+
+    @property
+    def address(self) -> int:
+        return ctypes.addressof(self._buffer) if self._buffer is not None else 0
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from ._scene import Scene, frames
+
+
+def about(batch: bool = False, version: bool = False, **kwargs):
+    if batch:
+        return Scene.batch
+    if version:
+        return "2024"
+    return None
+
+
+def currentTime(time=None, query: bool = False, update: bool = True, **kwargs):
+    if query or time is None:
+        return Scene.current_time
+    Scene.current_time = float(time)
+    return Scene.current_time
+
+
+def playbackOptions(query: bool = False, animationStartTime: bool = False,
+                    animationEndTime: bool = False, minTime=None, maxTime=None, **kwargs):
+    if animationStartTime or (query and minTime):
+        return float(Scene.start_frame)
+    if animationEndTime or (query and maxTime):
+        return float(Scene.end_frame)
+    return None
+
+
+_evaluation = {"mode": "parallel", "deformer": False, "cache": False}
+
+
+def evaluationManager(query: bool = False, mode=None, **kwargs):
+    if query:
+        return [_evaluation["mode"]]
+    if mode is not None:
+        _evaluation["mode"] = mode
+    return None
+
+
+def evaluator(name: str | None = None, query: bool = False, enable=None, **kwargs):
+    if query:
+        return _evaluation.get(name, False)
+    if enable is not None:
+        _evaluation[name] = bool(enable)
+    return None
+
+
+def cacheEvaluator(*args, **kwargs):
+    return None
+
+
+def undoInfo(query: bool = False, state: bool = False, **kwargs):
+    return True if query else None
+
+
+def getPanel(type: str | None = None, **kwargs):
+    return [Scene.panel] if type == "modelPanel" else []
+
+
+def modelPanel(name: str | None = None, query: bool = False, modelEditor: bool = False,
+               exists: bool = False, **kwargs):
+    if exists:
+        return name == Scene.panel
+    if modelEditor:
+        return Scene.panel
+    return Scene.panel
+
+
+def modelEditor(name: str | None = None, query: bool = False, edit: bool = False,
+                exists: bool = False, **kwargs):
+    if exists:
+        return name == Scene.panel
+    if query:
+        return False
+    return None
+
+
+def refresh(*args, **kwargs):
+    return None
+
+
+def file(*args, query: bool = False, sceneName: bool = False, modified: bool = False, **kwargs):
+    if sceneName:
+        return ""
+    if modified:
+        return True
+    return None
+
+
+def ls(*args, **kwargs):
+    return []
+
+
+def listRelatives(*args, **kwargs):
+    return []
+
+
+def ogsRender(frame: float = 1.0, width: int = 960, height: int = 540, **kwargs) -> str:
+    from PIL import Image
+
+    Scene.render_dir.mkdir(parents=True, exist_ok=True)
+    path = Scene.render_dir / "ogsRender.png"
+    Image.fromarray(frames(int(width), int(height)).get(frame), mode="RGBA").save(path, compress_level=1)
+
+    return str(path)
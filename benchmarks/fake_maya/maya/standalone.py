@@ -0,0 +1,6 @@
+def initialize(*args, **kwargs):
+    return None
+
+
+def uninitialize(*args, **kwargs):
+    return None
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+
+def wrapInstance(ptr: int, cls):
+    widget = cls()
+    widget._ptr = int(ptr)
+    return widget
+
+
+def getCppPointer(widget) -> tuple:
+    return (getattr(widget, "_ptr", 0),)
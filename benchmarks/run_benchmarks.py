@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import argparse
+import importlib.util
+import json
+import logging
+import platform
+import shutil
+import subprocess
+import sys
+import time
+import tracemalloc
+
+_BENCH_PATH = Path(__file__).parent
+_ROOT_PATH = _BENCH_PATH.parent
+_BASELINE_PATH = _BENCH_PATH / "baselines"
+
+sys.path.insert(0, str(_BENCH_PATH / "fake_maya"))
+
+import numpy as np
+
+from maya import OpenMayaUI as omui
+from maya._scene import Scene, frames
+from PySide2 import QtCore
+
+
+RESOLUTIONS = {"540p": (960, 540),
+               "720p": (1280, 720),
+               "1080p": (1920, 1080),
+               "1440p": (2560, 1440),
+               "2160p": (3840, 2160)}
+CODECS = ["libx264", "libx265", "prores_ks", "mjpeg"]
+WIRE_FORMATS = ["rgb24", "yuv420p"]
+NULL_CODEC = "null"
+
+
+def _load_package():
+    # The checkout folder is not necessarily named maya_playblast.
+    spec = importlib.util.spec_from_file_location("maya_playblast", _ROOT_PATH / "__init__.py",
+                                                  submodule_search_locations=[str(_ROOT_PATH)])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["maya_playblast"] = module
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def _null_sink(*args, **kwargs) -> subprocess.Popen:
+    # Drains the pipe without encoding, isolates capture and pipe throughput.
+    code = "import shutil, sys, os; shutil.copyfileobj(sys.stdin.buffer, open(os.devnull, 'wb'), 1 << 20)"
+    return subprocess.Popen([sys.executable, "-c", code], stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def _measure(name: str, frame_count: int, fn) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {"frames": frame_count,
+              "seconds": elapsed,
+              "fps": frame_count / elapsed if elapsed else 0.0,
+              "peak_mb": peak / 1024 ** 2}
+    print(f"{name:<40} {result['fps']:9.1f} fps   {result['peak_mb']:9.1f} MB peak")
+
+    return result
+
+
+def bench_view_backend(pb, width: int, height: int, frame_count: int) -> dict:
+    from maya_playblast.capture.backends.maya.view import ViewBackend
+    from maya_playblast.capture.config import ViewConfig
+
+    backend = ViewBackend(ViewConfig(view=omui.M3dView(width, height)))
+    backend.setup()
+    frames(width, height)
+
+    def run():
+        for frame in range(frame_count):
+            backend.release_frame(backend.capture_frame(frame))
+
+    try:
+        return _measure(f"ViewBackend {width}x{height}", frame_count, run)
+    finally:
+        backend.teardown()
+
+
+def bench_ogs_read_image(pb, width: int, height: int, frame_count: int) -> dict | None:
+    from maya_playblast.capture.backends.maya import ogs_render
+    from maya_playblast.capture.config import ViewConfig
+
+    if not ogs_render._available:
+        print(f"{'OgsRenderBackend._read_image':<40} skipped, Pillow is not installed")
+        return None
+
+    from maya import cmds
+    backend = ogs_render.OgsRenderBackend(ViewConfig(view=None, width=width, height=height))
+    image_path = Path(cmds.ogsRender(frame=1.0, width=width, height=height))
+
+    def run():
+        for _ in range(frame_count):
+            backend.release_frame(backend._read_image(image_path))
+
+    return _measure(f"OgsRenderBackend._read_image {width}x{height}", frame_count, run)
+
+
+def bench_ffmpeg_capture(pb, width: int, height: int, frame_count: int, codec: str) -> dict:
+    from maya_playblast.capture.config import CaptureConfig, ViewConfig
+    from maya_playblast.io import launchers
+    from maya_playblast.io.ffmpeg_supervisor import FFmpegSupervisor
+
+    output_path = Scene.render_dir / f"bench_{codec}_{width}x{height}.mp4"
+    output_path.unlink(missing_ok=True)
+    config = CaptureConfig(output_path=output_path, codec=codec, start_frame=0, end_frame=frame_count - 1)
+    view_cfg = ViewConfig(view=None, width=width, height=height)
+    generator = frames(width, height)
+
+    def run():
+        proc = _null_sink() if codec == NULL_CODEC else launchers.ffmpeg_capture(config, view_cfg)
+        supervisor = FFmpegSupervisor(proc).start()
+        for frame in range(frame_count):
+            supervisor.write(generator.get(frame))
+        supervisor.close()
+
+    try:
+        return _measure(f"ffmpeg_capture {codec} {width}x{height}", frame_count, run)
+    finally:
+        output_path.unlink(missing_ok=True)
+
+
+def bench_frame_capture(pb, width: int, height: int, frame_count: int, codec: str,
+                        encoder: str = "ffmpeg", wire_format: str = "rgba") -> dict:
+    from maya_playblast.capture.backends.maya.view import ViewBackend
+    from maya_playblast.capture.config import CaptureConfig, ViewConfig
+    from maya_playblast.capture.frame_capture import FrameCapture
+    from maya_playblast.io import launchers
+
+    suffix = ".mov" if codec.startswith("prores") else ".mp4"
+    output_path = Scene.render_dir / f"bench_capture_{encoder}_{codec}_{width}x{height}{suffix}"
+    output_path.unlink(missing_ok=True)
+    config = CaptureConfig(output_path=output_path, codec=codec, start_frame=0, end_frame=frame_count - 1,
+                           encoder=encoder, wire_format=wire_format)
+    view_cfg = ViewConfig(view=omui.M3dView(width, height))
+    frames(width, height)
+
+    ffmpeg_capture = launchers.ffmpeg_capture
+    if codec == NULL_CODEC:
+        launchers.ffmpeg_capture = _null_sink
+    try:
+        capture = FrameCapture(config, view_cfg, ViewBackend(view_cfg))
+        return _measure(f"FrameCapture.run {encoder} {codec} {wire_format} {width}x{height}",
+                        frame_count, capture.run)
+    finally:
+        launchers.ffmpeg_capture = ffmpeg_capture
+        output_path.unlink(missing_ok=True)
+
+
+def run(args: argparse.Namespace) -> dict:
+    pb = _load_package()
+    logging.getLogger("Playblast").setLevel(logging.WARNING)
+
+    ffmpeg_path = shutil.which("ffmpeg")
+    QtCore.QSettings._values["paths/ffmpeg"] = ffmpeg_path or "ffmpeg"
+    QtCore.QSettings._values["paths/player"] = "player"
+    codecs = [NULL_CODEC] + (args.codecs if ffmpeg_path else [])
+    if not ffmpeg_path:
+        print("ffmpeg not found in PATH, encoder benchmarks are skipped.\n")
+
+    results = {}
+    for name in args.resolutions:
+        width, height = RESOLUTIONS[name]
+        results[f"view_backend/{name}"] = bench_view_backend(pb, width, height, args.frames)
+        ogs_result = bench_ogs_read_image(pb, width, height, args.frames)
+        if ogs_result:
+            results[f"ogs_read_image/{name}"] = ogs_result
+        for codec in codecs:
+            results[f"ffmpeg_capture/{codec}/{name}"] = bench_ffmpeg_capture(pb, width, height, args.frames, codec)
+            results[f"frame_capture/{codec}/{name}"] = bench_frame_capture(pb, width, height, args.frames, codec)
+        for wire_format in WIRE_FORMATS:
+            results[f"frame_capture/{NULL_CODEC}/{wire_format}/{name}"] = bench_frame_capture(
+                pb, width, height, args.frames, NULL_CODEC, wire_format=wire_format)
+        if importlib.util.find_spec("av"):
+            for codec in args.codecs:
+                results[f"frame_capture_pyav/{codec}/{name}"] = bench_frame_capture(pb, width, height, args.frames,
+                                                                                   codec, encoder="pyav")
+        print()
+
+    return {"machine": platform.node(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "ffmpeg": ffmpeg_path,
+            "frames": args.frames,
+            "results": results}
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for key, result in report["results"].items():
+        reference = baseline["results"].get(key)
+        if not reference:
+            continue
+        if result["fps"] < reference["fps"] * (1.0 - tolerance):
+            regressions.append(f"{key}: {result['fps']:.1f} fps < baseline {reference['fps']:.1f} fps")
+        if result["peak_mb"] > reference["peak_mb"] * (1.0 + tolerance) + 1.0:
+            regressions.append(f"{key}: {result['peak_mb']:.1f} MB > baseline {reference['peak_mb']:.1f} MB")
+
+    return regressions
+
+
+def _parse_args() -> argparse.Namespace:
+    default_baseline = _BASELINE_PATH / f"{platform.node() or 'default'}.json"
+
+    parser = argparse.ArgumentParser(description="Benchmark the capture/encode pipeline against a fake Maya.")
+    parser.add_argument("--frames",      type=int, default=60, help="Frames per benchmark")
+    parser.add_argument("--resolutions", nargs="+", default=list(RESOLUTIONS), choices=list(RESOLUTIONS))
+    parser.add_argument("--codecs",      nargs="+", default=CODECS, help="Codecs for the encoder benchmarks")
+    parser.add_argument("--baseline",    type=str, default=str(default_baseline), help="Baseline JSON path")
+    parser.add_argument("--save",        action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--tolerance",   type=float, default=0.15, help="Allowed relative regression")
+    parser.add_argument("--output",      type=str, default=None, help="Write the results to this JSON file")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    report = run(args)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=4), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.save:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=4), encoding="utf-8")
+        print(f"Baseline saved : {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}, run with --save to create one.")
+        return 0
+
+    regressions = compare(report, json.loads(baseline_path.read_text(encoding="utf-8")), args.tolerance)
+    if regressions:
+        print("Regressions against baseline:\n\t" + "\n\t".join(regressions))
+        return 1
+    print(f"No regression against {baseline_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import time
+
+try:
+    from PySide2 import QtCore
+except:
+    from PySide6 import QtCore
+
+from ..capture.frame_capture import FrameCapture
+from ..core import signal
+from ..core.logger import log
+
+
+class AsyncCapture:
+
+    def __init__(self, capture: FrameCapture, budget: float = 0.03,
+                 parent: QtCore.QObject | None = None):
+        self._capture = capture
+        # Capture time spent per timer tick, Maya processes UI events in between.
+        self._budget = budget
+        self._steps = None
+        self._timer = QtCore.QTimer(parent)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._step)
+        self.on_finished = signal.Signal()
+
+    @property
+    def capture(self) -> FrameCapture:
+        return self._capture
+
+    @property
+    def running(self) -> bool:
+        return self._steps is not None
+
+    def start(self) -> None:
+        if self.running:
+            raise RuntimeError("Capture is already running.")
+        self._steps = self._capture.steps(interactive=True)
+        self._timer.start()
+
+    def cancel(self) -> None:
+        # Honoured before the next frame, queued frames are still encoded so the file stays valid.
+        self._capture.cancel()
+
+    def _step(self) -> None:
+        deadline = time.perf_counter() + self._budget
+        try:
+            while time.perf_counter() < deadline:
+                next(self._steps)
+        except StopIteration:
+            self._finish()
+        except Exception as e:
+            log.error(f"Capture failed: {e}")
+            self._finish()
+
+    def _finish(self) -> None:
+        self._timer.stop()
+        self._steps = None
+        self.on_finished.emit(self._capture.cancelled)
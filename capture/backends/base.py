@@ -1,24 +1,64 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 
 import numpy as np
 
 from ...capture.config import ViewConfig
+from ...capture.frame_pool import FramePool
+from ...core.profiler import CaptureProfiler
 
 
 class CaptureBackend(ABC):
 
+    # Frames are stored bottom-up and must be flipped by the encoder.
+    BOTTOM_UP = False
+
     def __init__(self, view_config: ViewConfig):
         self._view_cfg = view_config
+        self._pool: FramePool | None = None
+        self._profiler = CaptureProfiler(enabled=False)
+        # False changes time without UI updates, the backend then forces its own draw.
+        self._update_time = True
 
     @property
     def width(self) -> int:
-        return self._view_cfg.width
+        return int(self._view_cfg.width)
 
     @property
     def height(self) -> int:
-        return self._view_cfg.height
+        return int(self._view_cfg.height)
+
+    @property
+    def profiler(self) -> CaptureProfiler:
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: CaptureProfiler) -> None:
+        self._profiler = profiler
+
+    @property
+    def update_time(self) -> bool:
+        return self._update_time
+
+    @update_time.setter
+    def update_time(self, update: bool) -> None:
+        self._update_time = update
+
+    @property
+    def pool(self) -> FramePool:
+        if self._pool is None or self._pool.shape[:2] != (self.height, self.width):
+            self._pool = FramePool(self.width, self.height)
+        return self._pool
+
+    def allocate_pool(self, size: int) -> FramePool:
+        self._pool = FramePool(self.width, self.height, size)
+        return self._pool
+
+    def release_frame(self, buffer: np.ndarray) -> None:
+        if self._pool is not None:
+            self._pool.release(buffer)
 
     @abstractmethod
     def is_available(self) -> bool:
@@ -28,8 +68,12 @@ class CaptureBackend(ABC):
     def capture_frame(self, frame: int) -> np.ndarray:
         pass
 
+    def request_frame(self, frame: int) -> np.ndarray | Future:
+        # Backends may return a Future to finish the frame off the main thread.
+        return self.capture_frame(frame)
+
     def setup(self) -> None:
         pass
 
     def teardown(self) -> None:
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+
+import numpy as np
+
+from maya import cmds
+
+from ..backends.base import CaptureBackend
+from ..frame_cache import FrameCache
+from ..frame_pool import FramePool
+from ...core.logger import log
+from ...core.profiler import CaptureProfiler
+from ...maya import maya_ui, maya_utils, scene_state
+
+
+class CachedBackend(CaptureBackend):
+
+    def __init__(self, backend: CaptureBackend, cache: FrameCache, store_workers: int = 2):
+        super().__init__(backend._view_cfg)
+        self._backend = backend
+        self._cache = cache
+        self._store_workers = store_workers
+        self._executor: ThreadPoolExecutor | None = None
+        # Captured buffers waiting for the writer, stored in the cache once released.
+        self._pending: dict[int, str] = {}
+        self._pending_lock = Lock()
+        self.BOTTOM_UP = backend.BOTTOM_UP
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self) -> CaptureBackend:
+        return self._backend
+
+    @property
+    def cache(self) -> FrameCache:
+        return self._cache
+
+    @property
+    def profiler(self) -> CaptureProfiler:
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: CaptureProfiler) -> None:
+        self._profiler = profiler
+        self._backend.profiler = profiler
+
+    @property
+    def update_time(self) -> bool:
+        return self._backend.update_time
+
+    @update_time.setter
+    def update_time(self, update: bool) -> None:
+        self._backend.update_time = update
+
+    @property
+    def pool(self) -> FramePool:
+        return self._backend.pool
+
+    def allocate_pool(self, size: int) -> FramePool:
+        return self._backend.allocate_pool(size)
+
+    def release_frame(self, buffer: np.ndarray) -> None:
+        with self._pending_lock:
+            key = self._pending.pop(id(buffer), None)
+        if key is None:
+            self._backend.release_frame(buffer)
+        elif self._executor is None:
+            self._store_and_release(key, buffer)
+        else:
+            # Compression stays off the main thread, the buffer returns to the pool once stored.
+            self._executor.submit(self._store_and_release, key, buffer)
+
+    def is_available(self) -> bool:
+        return self._backend.is_available()
+
+    def setup(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        if self._store_workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=self._store_workers,
+                                                thread_name_prefix="CacheStore")
+        self._backend.setup()
+
+    def teardown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._backend.teardown()
+        log.debug(f"{self.__class__.__name__} — {self.hits} cached frames, {self.misses} captured, "
+                  f"cache {self._cache.size / 1024 ** 2:.0f} MB.")
+
+    @property
+    def camera(self) -> str:
+        view_cfg = self._view_cfg
+        return maya_ui.get_view_camera(view_cfg.view) if view_cfg.view else view_cfg.camera
+
+    def view_key(self) -> tuple:
+        flags = ",".join(f"{x.name}={int(x.value)}" for x in self._view_cfg.flags)
+        return self._backend.__class__.__name__, self.camera, self.width, self.height, flags
+
+    def scene_key(self, frame: int) -> tuple:
+        scene_path = cmds.file(query=True, sceneName=True)
+        if scene_path and not cmds.file(query=True, modified=True):
+            # Republished references change the frames without touching the scene file.
+            return tuple(maya_utils.get_scene_files())
+        # Unsaved changes, fall back to the evaluated scene state.
+        return self.state_key(frame)
+
+    def state_key(self, frame: int) -> tuple:
+        # Evaluate only, a miss draws through the backend's own time change on a clean graph.
+        maya_utils.current_time(frame, update=False)
+        # The hash leaves shading and lights out, the scene path keeps variants of one geometry apart.
+        return cmds.file(query=True, sceneName=True), scene_state.frame_state_hash(self.camera)
+
+    def frame_key(self, frame: int) -> str:
+        return FrameCache.make_key(*self.view_key(), frame, *self.scene_key(frame))
+
+    def capture_frame(self, frame: int) -> np.ndarray:
+        result = self.request_frame(frame)
+        return result.result() if isinstance(result, Future) else result
+
+    def request_frame(self, frame: int) -> np.ndarray | Future:
+        key = None
+        with self.profiler.stage("cache", frame):
+            try:
+                key = self.frame_key(frame)
+            except Exception as e:
+                log.warning(f"Failed to key frame {frame}, captured without cache — {e}")
+
+            if key is not None:
+                buffer = self.pool.acquire()
+                if self._cache.read_into(key, buffer):
+                    self.hits += 1
+                    return buffer
+                self.release_frame(buffer)
+
+        self.misses += 1
+        result = self._backend.request_frame(frame)
+        if key is None:
+            return result
+        if not isinstance(result, Future):
+            self._track(key, result)
+            return result
+
+        # Track before the writer sees the buffer, it is released right after encoding.
+        tracked = Future()
+        def on_done(future: Future):
+            try:
+                buffer = future.result()
+                self._track(key, buffer)
+            except BaseException as e:
+                tracked.set_exception(e)
+            else:
+                tracked.set_result(buffer)
+
+        result.add_done_callback(on_done)
+        return tracked
+
+    def _track(self, key: str, buffer: np.ndarray) -> None:
+        with self._pending_lock:
+            self._pending[id(buffer)] = key
+
+    def _store_and_release(self, key: str, buffer: np.ndarray) -> None:
+        try:
+            self._cache.write(key, buffer)
+        except Exception as e:
+            log.warning(f"Failed to cache frame — {e}")
+        finally:
+            self._backend.release_frame(buffer)
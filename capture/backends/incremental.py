@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from ..backends.cached import CachedBackend
+
+
+class IncrementalBackend(CachedBackend):
+
+    def scene_key(self, frame: int) -> tuple:
+        # Always key on the evaluated state so edited frames are re-captured.
+        return self.state_key(frame)
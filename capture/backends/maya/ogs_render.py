@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -20,8 +21,10 @@ from ....maya import maya_utils
 
 class OgsRenderBackend(CaptureBackend):
 
-    def __init__(self, view_config: ViewConfig):
+    def __init__(self, view_config: ViewConfig, decode_workers: int = 2):
         super().__init__(view_config)
+        self._decode_workers = decode_workers
+        self._executor: ThreadPoolExecutor | None = None
 
     def is_available(self) -> bool:
         is_batch = cmds.about(batch=True)
@@ -29,22 +32,59 @@ class OgsRenderBackend(CaptureBackend):
             log.debug("OGSRenderBackend not available because PIL is not installed.")
         return is_batch and _available
 
+    def setup(self) -> None:
+        if self._decode_workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=self._decode_workers,
+                                                thread_name_prefix="OgsDecode")
+
+    def teardown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def capture_frame(self, frame: int) -> np.ndarray:
-        maya_utils.current_time(frame)
+        return self._decode(self._render(frame), frame)
 
-        img_path = Path(cmds.ogsRender(frame=float(frame),
-                                       width=self._view_cfg.width,
-                                       height=self._view_cfg.height,
-                                       camera=self._view_cfg.camera,
-                                       currentView=True))
-        array = self._read_image(img_path)
-        # img_path.unlink()
+    def request_frame(self, frame: int) -> np.ndarray | Future:
+        img_path = self._render(frame)
+        if self._executor is None:
+            return self._decode(img_path, frame)
 
-        return array
+        return self._executor.submit(self._decode, img_path, frame)
 
-    def _read_image(self, path: Path) -> np.ndarray:
-        img = Image.open(path).convert("RGBA")
-        array = np.array(img, dtype=np.uint8)
+    def _render(self, frame: int) -> Path:
+        with self.profiler.stage("time", frame):
+            maya_utils.current_time(frame, update=self.update_time)
+
+        with self.profiler.stage("readback", frame):
+            img_path = Path(cmds.ogsRender(frame=float(frame),
+                                           width=self._view_cfg.width,
+                                           height=self._view_cfg.height,
+                                           camera=self._view_cfg.camera,
+                                           currentView=True))
+        # ogsRender may reuse the same file name, move it aside before decoding asynchronously.
+        staged_path = img_path.with_name(f"{img_path.stem}.{frame}{img_path.suffix}")
+        img_path.replace(staged_path)
 
-        return np.ascontiguousarray(array)
+        return staged_path
+
+    def _decode(self, path: Path, frame: int) -> np.ndarray:
+        try:
+            with self.profiler.stage("convert", frame):
+                return self._read_image(path)
+        finally:
+            try:
+                path.unlink()
+            except OSError as e:
+                log.warning(f"Failed to delete render {path} — {e}")
+
+    def _read_image(self, path: Path) -> np.ndarray:
+        buffer = self.pool.acquire()
+        try:
+            with Image.open(path) as img:
+                np.copyto(buffer, np.asarray(img.convert("RGBA"), dtype=np.uint8))
+        except Exception:
+            self.release_frame(buffer)
+            raise
 
+        return buffer
@@ -4,27 +4,59 @@ import ctypes
 
 import numpy as np
 
-from maya import cmds
+from maya import cmds, OpenMaya as om
 
 from ...backends.base import CaptureBackend
+from ...config import ViewConfig
 from ....core.logger import log
 from ....maya import maya_utils
 
 
 class ViewBackend(CaptureBackend):
 
+    # readColorBuffer returns rows bottom-up, ffmpeg flips them on encode.
+    BOTTOM_UP = True
+
+    def __init__(self, view_config: ViewConfig):
+        super().__init__(view_config)
+        self._image: om.MImage | None = None
+
     def is_available(self) -> bool:
         if cmds.about(batch=True):
             log.debug("ViewBackend not available in batch mode.")
             return False
         return True
 
-    def capture_frame(self, frame: int) -> np.ndarray:
-        maya_utils.current_time(frame)
+    def setup(self) -> None:
+        self._image = maya_utils.create_image()
 
-        img = maya_utils.create_image()
-        self._view_cfg.view.readColorBuffer(img, True)
-        buffer_bytes = ctypes.string_at(int(img.pixels()), self.width * self.height * 4)
-        pixel_array = np.frombuffer(buffer_bytes, dtype=np.uint8).reshape((self.height, self.width, 4))
+    def teardown(self) -> None:
+        self._image = None
 
-        return np.ascontiguousarray(pixel_array[::-1])
+    def capture_frame(self, frame: int) -> np.ndarray:
+        with self.profiler.stage("time", frame):
+            maya_utils.current_time(frame, update=self.update_time)
+
+        if self._image is None:
+            self._image = maya_utils.create_image()
+        with self.profiler.stage("readback", frame):
+            if not self.update_time:
+                self._view_cfg.view.refresh(False, True)
+            self._view_cfg.view.readColorBuffer(self._image, True)
+
+        buffer = self.pool.acquire()
+        try:
+            with self.profiler.stage("convert", frame):
+                np.copyto(buffer, self._image_view(self._image))
+        except Exception:
+            self.release_frame(buffer)
+            raise
+
+        return buffer
+
+    def _image_view(self, img: om.MImage) -> np.ndarray:
+        # Wrap MImage memory without copying, the ctypes buffer keeps the image alive.
+        buffer = (ctypes.c_uint8 * (self.width * self.height * 4)).from_address(int(img.pixels()))
+        buffer._image = img
+
+        return np.frombuffer(buffer, dtype=np.uint8).reshape((self.height, self.width, 4))
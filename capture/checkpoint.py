@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
+
+from ..capture.config import CaptureConfig, ViewConfig
+from ..capture.encoders.resolver import resolve_encoder
+from ..core.logger import log
+from ..io import launchers
+from ..maya import maya_utils
+
+
+class Checkpoint:
+
+    VERSION = 2
+    STATE_SUFFIX = ".checkpoint.json"
+
+    def __init__(self, config: CaptureConfig, view_cfg: ViewConfig):
+        self._output_path = Path(config.output_path)
+        self._segment_frames = config.checkpoint_frames
+        self._fingerprint = self.fingerprint(config, view_cfg)
+        self._ranges = [(start, min(start + self._segment_frames - 1, config.end_frame))
+                        for start in range(config.start_frame, config.end_frame + 1, self._segment_frames)]
+        self._completed: set[tuple[int, int]] = set()
+        self._encoder: str | None = None
+        self._load()
+
+    @property
+    def state_path(self) -> Path:
+        return self._output_path.with_name(f"{self._output_path.name}{self.STATE_SUFFIX}")
+
+    @property
+    def segment_dir(self) -> Path:
+        return self._output_path.with_name(f"{self._output_path.stem}_segments")
+
+    @property
+    def ranges(self) -> list[tuple[int, int]]:
+        return list(self._ranges)
+
+    @property
+    def pending(self) -> list[tuple[int, int]]:
+        return [x for x in self._ranges if x not in self._completed]
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.pending
+
+    @property
+    def encoder(self) -> str | None:
+        return self._encoder
+
+    def pin_encoder(self, config: CaptureConfig, view_cfg: ViewConfig) -> str:
+        # auto depends on the host, segments from two encoders cannot be joined with -c copy.
+        if self._encoder is not None:
+            pinned = replace(config, encoder=self._encoder)
+            if resolve_encoder(pinned, view_cfg).NAME == self._encoder:
+                return self._encoder
+            log.warning(f"Checkpoint {self.state_path} was encoded with {self._encoder}, "
+                        f"not usable here, start over.")
+            self.clear()
+
+        self._encoder = resolve_encoder(config, view_cfg).NAME
+        self._save()
+        return self._encoder
+
+    @staticmethod
+    def fingerprint(config: CaptureConfig, view_cfg: ViewConfig) -> str:
+        # Anything changing the encoded bytes invalidates finished segments.
+        output = config.outputs[0]
+        flags = ",".join(f"{x.name}={int(x.value)}" for x in view_cfg.flags)
+        # Re-saved scenes and republished references change the frames of the pending segments.
+        parts = [maya_utils.get_scene_files(),
+                 config.start_frame, config.end_frame, config.frame_rate, config.checkpoint_frames,
+                 config.encoder, config.wire_format,
+                 output.codec, output.crf, output.pix_fmt, output.scale, output.output_format,
+                 output.progressive, output.low_latency,
+                 view_cfg.width, view_cfg.height, view_cfg.camera, flags]
+        return hashlib.blake2b("\0".join(str(x) for x in parts).encode(), digest_size=16).hexdigest()
+
+    def segment_path(self, start_frame: int, end_frame: int) -> Path:
+        suffix = self._output_path.suffix
+        return self.segment_dir / f"{self._output_path.stem}.{start_frame:06d}-{end_frame:06d}{suffix}"
+
+    def mark_complete(self, start_frame: int, end_frame: int) -> None:
+        self._completed.add((start_frame, end_frame))
+        self._save()
+
+    def finalize(self) -> Path:
+        segments = [self.segment_path(*x) for x in self._ranges]
+        launchers.ffmpeg_concat(segments, self._output_path)
+        self.clear()
+
+        return self._output_path
+
+    def clear(self) -> None:
+        shutil.rmtree(self.segment_dir, ignore_errors=True)
+        self.state_path.unlink(missing_ok=True)
+        self._completed.clear()
+        self._encoder = None
+
+    def _load(self) -> None:
+        if not self.state_path.exists():
+            return
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            log.warning(f"Unreadable checkpoint {self.state_path}, start over — {e}")
+            self.clear()
+            return
+
+        if state.get("version") != self.VERSION or state.get("fingerprint") != self._fingerprint:
+            log.warning(f"Checkpoint {self.state_path} belongs to another capture setup, start over.")
+            self.clear()
+            return
+
+        self._encoder = state.get("encoder")
+        # A segment only counts if its file survived the interruption.
+        for start, end in state.get("completed", []):
+            if (start, end) in self._ranges and self.segment_path(start, end).exists():
+                self._completed.add((start, end))
+        if self._completed:
+            log.info(f"Resume capture, {len(self._completed)}/{len(self._ranges)} segments already done.")
+
+    def _save(self) -> None:
+        state = {"version": self.VERSION,
+                 "fingerprint": self._fingerprint,
+                 "encoder": self._encoder,
+                 "completed": sorted(self._completed)}
+
+        # Write aside then rename, a crash never leaves a truncated state file.
+        tmp_path = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(state, indent=4), encoding="utf-8")
+        tmp_path.replace(self.state_path)
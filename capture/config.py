@@ -5,11 +5,68 @@ from pathlib import Path
 
 from maya import cmds, OpenMayaUI as omui
 
+from ..capture.pixel_format import WIRE_FORMATS
+from ..core import constants
 from ..io import io_utils
 from ..maya import maya_ui, maya_utils
 from ..maya.viewport import ViewportFlags, VIEWPORT_FLAGS
 
 
+@dataclass
+class EvaluationConfig:
+
+    # evaluationManager mode: "off" (DG), "serial" or "parallel"
+    mode: str = "parallel"
+    # None leaves the GPU override (deformer evaluator) as the user set it
+    gpu_override: bool | None = None
+    cached_playback: bool = False
+    # Change time without UI updates, the capture itself pulls the evaluation
+    light_time_change: bool = True
+
+    def __post_init__(self) -> None:
+        if self.mode not in ("off", "serial", "parallel"):
+            raise ValueError(f"Evaluation mode must be off, serial or parallel, got {self.mode}")
+
+
+@dataclass
+class OutputConfig:
+
+    output_path: str | Path
+    codec: str = "libx264"
+    crf: int | None = 24
+    scale: float = 1.0
+    pix_fmt: str | None = "yuv444p"
+    # Muxer passed to -f, guessed from the extension or the stream protocol when None
+    output_format: str | None = None
+    # Short GOP, no B-frames and no lookahead, None enables it for network streams
+    low_latency: bool | None = None
+    # Fragmented MP4/MOV, readable while written and after a crash
+    progressive: bool = False
+
+    def __post_init__(self) -> None:
+        if self.crf is not None and (self.crf < 0 or self.crf > 51):
+            raise ValueError(f"CRF must be between 0 and 51, got {self.crf}")
+        if self.scale <= 0:
+            raise ValueError(f"Scale must be strictly positive, got {self.scale}")
+
+        if self.is_stream:
+            if self.low_latency is None:
+                self.low_latency = True
+            return
+        if isinstance(self.output_path, str) and not io_utils.is_stream_url(self.output_path):
+            self.output_path = Path(self.output_path)
+        if isinstance(self.output_path, Path) and self.output_path.exists():
+            self.output_path = io_utils.increment_file_path(self.output_path)
+
+    @property
+    def is_image_sequence(self) -> bool:
+        return not self.is_stream and "%" in self.output_path.name
+
+    @property
+    def is_stream(self) -> bool:
+        return io_utils.is_stream_url(self.output_path)
+
+
 @dataclass
 class CaptureConfig:
 
@@ -22,27 +79,84 @@ class CaptureConfig:
     # For custom panel
     width: int | None = 1920 * 0.5
     height: int | None = 1080 * 0.5
+    # Capture through a reused offscreen panel at width x height instead of the source view
+    offscreen: bool = False
+    # Progressive primary output, and frames written before on_preview_ready fires
+    progressive: bool = False
+    preview_after: int | None = None
+    # Encode in segments of that many frames with a state file, so interrupted captures resume
+    checkpoint_frames: int | None = None
+    # "auto" encodes in-process with PyAV when possible, "pyav" or "ffmpeg" to force one
+    encoder: str = "auto"
+    # Pixel format sent to the ffmpeg process: rgba, rgb24, or yuv422p/yuv420p converted before the pipe
+    wire_format: str = "rgba"
+    # Seconds a frame write may block before ffmpeg is considered stalled and killed
+    stall_timeout: float | None = 60.0
+    # Frames buffered between capture and encoder, 0 writes synchronously
+    queue_size: int = 8
+    # Reuse frames cached by scene/camera/flags/resolution, or by evaluated state when incremental
+    cache_frames: bool = False
+    incremental: bool = False
+    cache_path: str | Path | None = None
+    cache_max_bytes: int | None = constants.CACHE_MAX_BYTES
+    # Extra outputs encoded from the same capture, the primary output is inserted first
+    outputs: list[OutputConfig] = field(default_factory=list)
+    # Per-stage timings, trace written as JSON or CSV depending on the suffix
+    profile: bool = False
+    trace_path: str | Path | None = None
+    # Only redraw the captured view, pause undo and global UI updates, blocking captures only
+    isolate: bool = False
+    # Evaluation manager setup during the capture, None keeps the user settings
+    evaluation: EvaluationConfig | None = None
 
     def __post_init__(self) -> None:
         if self.crf < 0 or self.crf > 51:
             raise ValueError(f"CRF must be between 0 and 51, got {self.crf}")
+        if self.queue_size < 0:
+            raise ValueError(f"Queue size must be positive, got {self.queue_size}")
+        if self.encoder not in ("auto", "pyav", "ffmpeg"):
+            raise ValueError(f"Encoder must be auto, pyav or ffmpeg, got {self.encoder}")
+        if self.wire_format not in WIRE_FORMATS:
+            raise ValueError(f"Wire format must be one of {', '.join(WIRE_FORMATS)}, got {self.wire_format}")
+        if self.checkpoint_frames is not None and self.checkpoint_frames < 1:
+            raise ValueError(f"Checkpoint segment length must be at least 1, got {self.checkpoint_frames}")
+        if self.preview_after is not None and self.preview_after < 1:
+            raise ValueError(f"Preview frame count must be at least 1, got {self.preview_after}")
         
-        if isinstance(self.output_path, str):
+        # Stream URLs stay strings, Path would collapse the double slash.
+        if isinstance(self.output_path, str) and not io_utils.is_stream_url(self.output_path):
             self.output_path = Path(self.output_path)
-        if self.output_path.exists():
+        if isinstance(self.output_path, Path) and self.output_path.exists():
             self.output_path = io_utils.increment_file_path(self.output_path)
 
+        outputs = [x if isinstance(x, OutputConfig) else OutputConfig(**x) for x in self.outputs]
+        if not any(x.output_path == self.output_path for x in outputs):
+            outputs.insert(0, OutputConfig(self.output_path, self.codec, self.crf, progressive=self.progressive))
+        self.outputs = outputs
+        if isinstance(self.evaluation, dict):
+            self.evaluation = EvaluationConfig(**self.evaluation)
+
         if self.start_frame is None:
             self.start_frame = maya_utils.get_animation_start()
         if self.end_frame is None:
             self.end_frame = maya_utils.get_animation_end()
         if self.frame_rate is None:
             self.frame_rate = maya_utils.get_frame_rate()
+        if self.cache_path is None:
+            self.cache_path = constants.CACHE_PATH
 
     @property
     def frame_count(self) -> int:
         return self.end_frame - self.start_frame + 1
 
+    @property
+    def preview_output(self) -> OutputConfig | None:
+        # First output a player can open while it is being written.
+        for output in self.outputs:
+            if output.is_stream or (output.progressive and not output.is_image_sequence):
+                return output
+        return None
+
 
 
 @dataclass
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from threading import Thread
 
 from maya import cmds, OpenMayaUI as omui
 
 from ..core.logger import log
 from ..core import constants
-from ..io import launchers
-from ..maya import maya_ui, viewport
-from ..capture.config import CaptureConfig, ViewConfig
+from ..core.profiler import CaptureProfiler
+from ..maya import maya_ui, maya_utils, viewport
+from ..capture.config import CaptureConfig, EvaluationConfig, ViewConfig
+from ..capture.encoders.resolver import resolve_encoder
 
 
 @contextmanager
@@ -26,9 +26,82 @@ def SetEditorFlag(view_cfg: ViewConfig):
 
     states = viewport.VIEWPORT_FLAGS.snapshot(name)
     try:
-        yield viewport.set_viewport_states(name, view_cfg.flags)
+        yield viewport.set_viewport_states(name, view_cfg.flags, current=states)
     finally:
-        viewport.set_viewport_states(name, states)
+        viewport.set_viewport_states(name, states, current=view_cfg.flags)
+
+
+@contextmanager
+def IsolateCapture(view_cfg: ViewConfig, enabled: bool = True):
+    # Nothing to isolate without an interactive view.
+    if not enabled or not view_cfg.view:
+        yield
+        return
+
+    capture_editor = maya_ui.get_editor_from_view(view_cfg.view)
+
+    undo_state = maya_utils.is_undo_enabled()
+    editors = {}
+    widgets = []
+    try:
+        if undo_state:
+            maya_utils.enable_undo(False)
+
+        # Other viewports keep drawing on every time change, strip them down to nothing.
+        for editor in maya_ui.get_model_editors():
+            if editor == capture_editor:
+                continue
+            states = viewport.VIEWPORT_FLAGS.snapshot(editor)
+            hidden = states.copy()
+            for flag in hidden:
+                flag.value = False
+            viewport.set_viewport_states(editor, hidden, current=states)
+            editors[editor] = (states, hidden)
+
+        for widget in maya_ui.get_global_controls():
+            if widget.updatesEnabled():
+                widget.setUpdatesEnabled(False)
+                widgets.append(widget)
+        yield
+    finally:
+        for widget in widgets:
+            try:
+                widget.setUpdatesEnabled(True)
+            except RuntimeError:
+                pass
+        for editor, (states, hidden) in editors.items():
+            try:
+                viewport.set_viewport_states(editor, states, current=hidden)
+            except Exception as e:
+                log.warning(f"Failed to restore viewport {editor}: {e}")
+        if undo_state:
+            maya_utils.enable_undo(True)
+
+
+@contextmanager
+def PlaybackEvaluation(eval_cfg: EvaluationConfig | None, start_frame: int, end_frame: int):
+    if eval_cfg is None:
+        yield
+        return
+
+    mode = maya_utils.get_evaluation_mode()
+    gpu_override = maya_utils.is_evaluator_enabled("deformer")
+    cached_playback = maya_utils.is_evaluator_enabled("cache")
+    try:
+        maya_utils.set_evaluation_mode(eval_cfg.mode)
+        if eval_cfg.gpu_override is not None:
+            maya_utils.enable_evaluator("deformer", eval_cfg.gpu_override)
+        if eval_cfg.cached_playback and eval_cfg.mode != "off":
+            maya_utils.enable_evaluator("cache", True)
+            maya_utils.fill_playback_cache(start_frame, end_frame)
+        yield
+    finally:
+        try:
+            maya_utils.enable_evaluator("cache", cached_playback)
+            maya_utils.enable_evaluator("deformer", gpu_override)
+            maya_utils.set_evaluation_mode(mode)
+        except Exception as e:
+            log.warning(f"Failed to restore evaluation settings: {e}")
 
 
 @contextmanager
@@ -41,36 +114,18 @@ def UseNewPanel(width: int, height: int):
 
 
 @contextmanager
-def ImageToVideo(config_cfg: CaptureConfig, view_cfg: ViewConfig):
-    proc = launchers.ffmpeg_capture(config_cfg, view_cfg)
-
-    stderr_lines = []
-    def drain_stderr():
-        for line in proc.stderr:
-            stderr_lines.append(line.decode(errors="replace").strip())
-
-    stderr_thread = Thread(target=drain_stderr, daemon=True)
-    stderr_thread.start()
+def ImageToVideo(config_cfg: CaptureConfig, view_cfg: ViewConfig, vflip: bool = False,
+                 profiler: CaptureProfiler | None = None):
+    encoder = resolve_encoder(config_cfg, view_cfg, vflip=vflip, profiler=profiler)
+    encoder.open()
 
     try:
-        yield proc
+        yield encoder
     except Exception as e:
         log.error(e)
         raise e
     finally:
-        try:
-            proc.stdin.close()
-        except Exception as e:
-            log.warning(f"Failed to close stdin: {e}")
-
-        stderr_thread.join()
-        if stderr_lines:
-            log.error("ffmpeg stderr:\n" + "\n".join(stderr_lines))
-        try:
-            proc.wait(timeout=30)
-        except Exception as e:
-            log.error("FFmpeg did not terminate in time, killing process.")
-            proc.kill()
+        encoder.close()
 
 
 @contextmanager
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from ...capture.config import CaptureConfig, ViewConfig
+from ...core import signal
+from ...core.profiler import CaptureProfiler
+
+
+class Encoder(ABC):
+
+    # Value of CaptureConfig.encoder that forces this encoder.
+    NAME = ""
+
+    def __init__(self, config: CaptureConfig, view_config: ViewConfig,
+                 vflip: bool = False, profiler: CaptureProfiler | None = None):
+        self._config_cfg = config
+        self._view_cfg = view_config
+        self._vflip = vflip
+        self._profiler = profiler if profiler else CaptureProfiler(enabled=False)
+        # frame, fps, bitrate (kbit/s), speed
+        self.on_progress = signal.Signal()
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        pass
+
+    @abstractmethod
+    def open(self) -> None:
+        pass
+
+    @property
+    def converts(self) -> bool:
+        return False
+
+    def convert(self, buffer: np.ndarray) -> np.ndarray:
+        # Pixels as written by write(), the result may be reused by the next call.
+        return buffer
+
+    @abstractmethod
+    def write(self, buffer: np.ndarray) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> int | None:
+        pass
+
+    @abstractmethod
+    def poll(self) -> int | None:
+        # None while the encoder accepts frames, the exit code once it stopped.
+        pass
+
+    @property
+    @abstractmethod
+    def returncode(self) -> int | None:
+        pass
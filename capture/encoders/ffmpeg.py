@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ...capture.encoders.base import Encoder
+from ...capture.pixel_format import WireConverter, wire_format_for
+from ...io import launchers
+from ...io.ffmpeg_supervisor import FFmpegSupervisor
+
+
+class FFmpegEncoder(Encoder):
+
+    NAME = "ffmpeg"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._supervisor: FFmpegSupervisor | None = None
+        self._converter: WireConverter | None = None
+
+    def is_available(self) -> bool:
+        # Last resort, a missing ffmpeg is reported when the process starts.
+        return True
+
+    def open(self) -> None:
+        width, height = int(self._view_cfg.width), int(self._view_cfg.height)
+        wire_format = wire_format_for(self._config_cfg.wire_format, width, height)
+        self._converter = WireConverter(width, height, wire_format)
+        proc = launchers.ffmpeg_capture(self._config_cfg, self._view_cfg, vflip=self._vflip, wire_format=wire_format)
+        listening = any(launchers.stream_protocol(x) == "http" for x in self._config_cfg.outputs)
+        self._supervisor = FFmpegSupervisor(proc, stall_timeout=self._config_cfg.stall_timeout,
+                                            profiler=self._profiler, listening=listening)
+        self._supervisor.on_progress.register(self.on_progress.emit)
+        self._supervisor.start()
+
+    @property
+    def converts(self) -> bool:
+        return self._converter is not None and self._converter.wire_format != "rgba"
+
+    def convert(self, buffer: np.ndarray) -> np.ndarray:
+        # Runs on the writer thread, the conversion overlaps the next capture.
+        return self._converter.convert(buffer)
+
+    def write(self, buffer: np.ndarray) -> None:
+        self._supervisor.write(buffer)
+
+    def close(self) -> int | None:
+        return self._supervisor.close()
+
+    def poll(self) -> int | None:
+        return self._supervisor.poll()
+
+    @property
+    def returncode(self) -> int | None:
+        return self._supervisor.returncode if self._supervisor else None
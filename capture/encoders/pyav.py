@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from fractions import Fraction
+import time
+
+import numpy as np
+
+_available = True
+try:
+    import av
+except ImportError:
+    _available = False
+
+from ...capture.config import OutputConfig
+from ...capture.encoders.base import Encoder
+from ...core.constants import FASTEST_ENCODER
+from ...core.logger import log
+from ...io import ffmpeg_probe, io_utils
+
+
+class PyAVEncoder(Encoder):
+
+    NAME = "pyav"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._outputs: list[tuple] = []
+        self._returncode: int | None = None
+        self._index = 0
+        self._start = 0.0
+
+    def is_available(self) -> bool:
+        if not _available:
+            log.debug("PyAVEncoder not available because PyAV is not installed.")
+            return False
+        # The subprocess path pads odd sizes and scales, keep those cases there.
+        if self._view_cfg.width % 2 or self._view_cfg.height % 2:
+            return False
+        for output in self._config_cfg.outputs:
+            if output.is_stream or output.is_image_sequence or output.scale != 1.0:
+                return False
+            if output.codec == FASTEST_ENCODER or output.codec not in av.codecs_available:
+                return False
+            # Listed hardware encoders only fail once the first frame is encoded, ffmpeg probes them.
+            if ffmpeg_probe.is_hardware(output.codec):
+                return False
+        return True
+
+    def open(self) -> None:
+        rate = Fraction(self._config_cfg.frame_rate).limit_denominator(1001)
+        try:
+            for output in self._config_cfg.outputs:
+                io_utils.check_directory(output.output_path, build=True)
+                container = av.open(str(output.output_path), "w", format=output.output_format,
+                                    options=self._container_options(output))
+                stream = container.add_stream(output.codec, rate=rate)
+                stream.width = self._view_cfg.width
+                stream.height = self._view_cfg.height
+                stream.pix_fmt = self._pix_fmt(output)
+                # Frame and slice threads inside libav, encoding runs off the GIL.
+                stream.thread_type = "AUTO"
+                stream.options = self._codec_options(output)
+                self._outputs.append((container, stream))
+        except Exception:
+            self._returncode = 1
+            self._close_containers()
+            raise
+        self._start = time.perf_counter()
+
+    def write(self, buffer: np.ndarray) -> None:
+        if self._returncode is not None:
+            raise RuntimeError(f"Encoder stopped with code {self._returncode}.")
+
+        # One copy into the AVFrame, flipped on the way, colour conversion happens in swscale per stream.
+        frame = av.VideoFrame(self._view_cfg.width, self._view_cfg.height, "rgba")
+        plane = frame.planes[0]
+        rows = np.frombuffer(plane, dtype=np.uint8).reshape(frame.height, plane.line_size)
+        np.copyto(rows[:, :frame.width * 4].reshape(frame.height, frame.width, 4),
+                  buffer[::-1] if self._vflip else buffer)
+        frame.pts = self._index
+        try:
+            for container, stream in self._outputs:
+                for packet in stream.encode(frame):
+                    container.mux(packet)
+        except Exception:
+            self._returncode = 1
+            raise
+        self._index += 1
+
+        if self._index % max(int(self._config_cfg.frame_rate), 1) == 0:
+            elapsed = time.perf_counter() - self._start
+            fps = self._index / elapsed if elapsed else 0.0
+            speed = fps / self._config_cfg.frame_rate
+            self._profiler.record_encoder(self._index, fps, speed)
+            self.on_progress.emit(self._index, fps, None, speed)
+
+    def close(self) -> int | None:
+        if self._returncode is None:
+            try:
+                for container, stream in self._outputs:
+                    for packet in stream.encode(None):
+                        container.mux(packet)
+                self._returncode = 0
+            except Exception as e:
+                log.error(f"PyAV failed to flush the encoders — {e}")
+                self._returncode = 1
+        self._close_containers()
+
+        return self._returncode
+
+    def poll(self) -> int | None:
+        return self._returncode
+
+    @property
+    def returncode(self) -> int | None:
+        return self._returncode
+
+    def _close_containers(self) -> None:
+        for container, _ in self._outputs:
+            try:
+                container.close()
+            except Exception as e:
+                log.error(f"Failed to close {container.name} — {e}")
+        self._outputs = []
+
+    def _pix_fmt(self, output: OutputConfig) -> str:
+        supported = tuple(x.name for x in av.Codec(output.codec, "w").video_formats or ())
+        if not supported:
+            return output.pix_fmt or "yuv420p"
+        return ffmpeg_probe.pick_pix_fmt(supported, output.pix_fmt)
+
+    def _codec_options(self, output: OutputConfig) -> dict[str, str]:
+        # Same rate control as the subprocess path, -key value pairs as libav options.
+        args = ffmpeg_probe.rate_control_args(output.codec, output.crf, low_latency=bool(output.low_latency))
+        args += ffmpeg_probe.keyframe_args(self._config_cfg.frame_rate, bool(output.low_latency), output.progressive)
+
+        return ffmpeg_probe.to_options(args)
+
+    def _container_options(self, output: OutputConfig) -> dict[str, str]:
+        if not output.progressive:
+            return {}
+        return ffmpeg_probe.to_options(ffmpeg_probe.progressive_args(output.output_path.suffix))
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from ..encoders.base import Encoder
+from ..encoders.ffmpeg import FFmpegEncoder
+from ..encoders.pyav import PyAVEncoder
+from ..config import CaptureConfig, ViewConfig
+from ...core.logger import log
+from ...core.profiler import CaptureProfiler
+
+
+_ENCODERS: dict[str, type[Encoder]] = {x.NAME: x for x in (PyAVEncoder, FFmpegEncoder)}
+
+
+def resolve_encoder(config: CaptureConfig, view_config: ViewConfig, vflip: bool = False,
+                    profiler: CaptureProfiler | None = None) -> Encoder:
+    # auto prefers the in-process encoder, the ffmpeg subprocess is the fallback for everything else.
+    names = list(_ENCODERS) if config.encoder == "auto" else [config.encoder, "ffmpeg"]
+    for name in dict.fromkeys(names):
+        encoder = _ENCODERS[name](config, view_config, vflip=vflip, profiler=profiler)
+        if encoder.is_available():
+            log.debug(f"Selected Encoder : {encoder.__class__.__name__}")
+            return encoder
+        if name == config.encoder:
+            log.warning(f"Encoder {name} not usable for this capture, fallback on ffmpeg.")
+
+    raise RuntimeError("No encoder available, check the FFmpeg path in the settings.")
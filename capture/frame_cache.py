@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import os
+import threading
+import zlib
+
+import numpy as np
+
+from ..core.logger import log
+
+
+class FrameCache:
+
+    SUFFIX = ".frame"
+
+    def __init__(self, root: str | Path, max_bytes: int | None = None, compression: int = 1):
+        self._root = Path(root)
+        self._max_bytes = max_bytes
+        self._compression = compression
+        self._lock = threading.Lock()
+        # Entry sizes ordered from least to most recently used.
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._scan()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def max_bytes(self) -> int | None:
+        return self._max_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        for part in parts:
+            digest.update(str(part).encode())
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self._root / key[:2] / f"{key}{self.SUFFIX}"
+
+    def contains(self, key: str) -> bool:
+        return self.path_for(key).exists()
+
+    def read_into(self, key: str, buffer: np.ndarray) -> bool:
+        path = self.path_for(key)
+        try:
+            data = zlib.decompress(path.read_bytes())
+        except FileNotFoundError:
+            self._forget(key)
+            return False
+        except (OSError, zlib.error) as e:
+            log.warning(f"Corrupted cache entry {path} — {e}")
+            self.remove(key)
+            return False
+
+        if len(data) != buffer.nbytes:
+            log.warning(f"Cache entry {path} has an unexpected size, ignored.")
+            return False
+        buffer.reshape(-1)[:] = np.frombuffer(data, dtype=np.uint8)
+        self._touch(key, path)
+
+        return True
+
+    def write(self, key: str, buffer: np.ndarray) -> Path:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write aside then rename so readers never see partial entries.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        data = zlib.compress(memoryview(buffer).cast("B"), self._compression)
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+        with self._lock:
+            self._size += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+        self._evict()
+
+        return path
+
+    def remove(self, key: str) -> None:
+        self.path_for(key).unlink(missing_ok=True)
+        self._forget(key)
+
+    def clear(self) -> None:
+        for key in list(self._entries):
+            self.remove(key)
+
+    def _scan(self) -> None:
+        entries = []
+        for path in self._root.glob(f"*/*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._size += size
+        self._evict()
+
+    def _touch(self, key: str, path: Path) -> None:
+        # The file mtime persists the LRU order across sessions.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+
+    def _evict(self) -> None:
+        if self._max_bytes is None:
+            return
+
+        evicted = []
+        with self._lock:
+            while self._size > self._max_bytes and len(self._entries) > 1:
+                key, size = self._entries.popitem(last=False)
+                self._size -= size
+                evicted.append(key)
+
+        for key in evicted:
+            self.path_for(key).unlink(missing_ok=True)
+        if evicted:
+            log.debug(f"Frame cache evicted {len(evicted)} entries, {self._size / 1024 ** 2:.0f} MB used.")
@@ -1,59 +1,334 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import AsyncIterator, Iterator
+import asyncio
+
+import numpy as np
+
 from ..capture import context
 from ..capture.backends.base import CaptureBackend
+from ..capture.backends.cached import CachedBackend
+from ..capture.backends.incremental import IncrementalBackend
 from ..capture.backends.resolver import resolve_backend
+from ..capture.checkpoint import Checkpoint
+from ..capture.frame_cache import FrameCache
+from ..capture.frame_writer import FrameWriter
 from ..core import signal
-from ..capture.config import CaptureConfig, ViewConfig
+from ..core.cancellation import CancellationToken
+from ..core.profiler import CaptureProfiler
+from ..capture.config import CaptureConfig, OutputConfig, ViewConfig
 from ..core.logger import log
+from ..io import io_utils
+from ..maya import maya_ui
 
 
 class FrameCapture:
 
     def __init__(self, capture_config: CaptureConfig,
                  view_config: ViewConfig | None = None,
-                 backend: CaptureBackend | None = None):
+                 backend: CaptureBackend | None = None,
+                 token: CancellationToken | None = None):
         
         self._view_cfg = view_config if view_config else ViewConfig.from_active()
         self._config_cfg = capture_config
+        if capture_config.offscreen:
+            self._view_cfg = self._offscreen_view_config(self._view_cfg)
         self.on_capture_complete = signal.Signal()
         self.on_progress = signal.Signal()
+        self.on_preview_ready = signal.Signal()
+        self.token = token if token else CancellationToken()
+        self._encoded = 0
+        self.profiler = CaptureProfiler(enabled=capture_config.profile or bool(capture_config.trace_path))
 
         self._backend = backend if backend else resolve_backend(self._view_cfg)
+        if not isinstance(self._backend, CachedBackend):
+            if capture_config.incremental:
+                self._backend = IncrementalBackend(self._backend, self._frame_cache())
+            elif capture_config.cache_frames:
+                self._backend = CachedBackend(self._backend, self._frame_cache())
 
     def run(self):
+        for _ in self.steps():
+            pass
 
+    def steps(self, interactive: bool = False) -> Iterator[int]:
+        # Yields after each captured frame, lets an event loop drive the capture.
+        # Interactive runs hand control back to the artist between frames, never isolate those.
         cfg = self._config_cfg
+        isolate = cfg.isolate and not interactive
+        if cfg.isolate and interactive:
+            log.debug("Isolation skipped, the session stays editable between frames.")
 
         log.debug(
             f"Starting capture [{self._backend.__class__.__name__}] — "
             f"frames [{cfg.start_frame} → {cfg.end_frame}], "
             f"size {self._view_cfg.width}x{self._view_cfg.height}, "
-            f"fps {cfg.frame_rate}, codec {cfg.codec}, crf {cfg.crf}"
+            f"fps {cfg.frame_rate}, queue {cfg.queue_size}, outputs "
+            f"{', '.join(f'{x.output_path if x.is_stream else x.output_path.name} ({x.codec})' for x in cfg.outputs)}"
         )
 
+        checkpoint = self._checkpoint()
         try:
-            self._backend.setup()
-            with context.SetEditorFlag(self._view_cfg):
-                with context.ImageToVideo(cfg, self._view_cfg) as proc:
-                    for i in range(cfg.frame_count):
-                        current = cfg.start_frame + i
-
-                        if proc.poll() is not None:
-                            log.error(f"FFmpeg terminated prematurely at frame {current}.")
-                            break
+            # One buffer being captured, one being written, the rest queued.
+            with self._session(cfg.queue_size + 2, cfg.start_frame, cfg.end_frame, isolate=isolate):
+                if checkpoint is None:
+                    completed = yield from self._encode_range(cfg, cfg.start_frame, cfg.end_frame)
+                else:
+                    completed = yield from self._encode_segments(checkpoint)
 
-                        try:
-                            raw = self._backend.capture_frame(current).tobytes()
-                            proc.stdin.write(raw)
-                            self.on_progress.emit()
-                        except Exception as frame_err:
-                            log.warning(f"Frame {current} skipped — {frame_err}")
-            
-            self.on_capture_complete.emit(cfg.output_path)
+            if checkpoint is not None and completed:
+                checkpoint.finalize()
+            if completed:
+                self.on_capture_complete.emit(cfg.output_path)
         except Exception as e:
             log.error(f"Capture failed: {e}")
+
+        if self.profiler.enabled:
+            self.profiler.log_summary()
+            if cfg.trace_path:
+                log.debug(f"Capture trace — {self.profiler.write_trace(cfg.trace_path)}")
+
+        log.debug(f"Capture complete — {cfg.output_path}")
+
+    def _encode_segments(self, checkpoint: Checkpoint) -> Iterator[int]:
+        cfg = self._config_cfg
+        encoder = checkpoint.pin_encoder(cfg, self._view_cfg)
+        for start_frame, end_frame in checkpoint.pending:
+            segment_path = checkpoint.segment_path(start_frame, end_frame)
+            segment_path.parent.mkdir(parents=True, exist_ok=True)
+            # Leftover of an interrupted run, never reuse a partial segment.
+            segment_path.unlink(missing_ok=True)
+            segment_cfg = replace(cfg, output_path=segment_path,
+                                  outputs=[replace(cfg.outputs[0], output_path=segment_path, progressive=False)],
+                                  start_frame=start_frame, end_frame=end_frame, preview_after=None,
+                                  encoder=encoder)
+
+            completed = yield from self._encode_range(segment_cfg, start_frame, end_frame)
+            if not completed:
+                return False
+            checkpoint.mark_complete(start_frame, end_frame)
+
+        return True
+
+    def _encode_range(self, encode_cfg: CaptureConfig, start_frame: int, end_frame: int) -> Iterator[int]:
+        cfg = self._config_cfg
+        completed = False
+        with context.ImageToVideo(encode_cfg, self._view_cfg, vflip=self._backend.BOTTOM_UP,
+                                  profiler=self.profiler) as proc:
+            writer = FrameWriter(proc, cfg.queue_size, release=self._backend.release_frame,
+                                 profiler=self.profiler)
+            writer.start()
+            preview = encode_cfg.preview_output if encode_cfg.preview_after else None
+            self._encoded = 0
+            proc.on_progress.register(self._on_encoder_progress)
+            try:
+                for current in range(start_frame, end_frame + 1):
+                    done = current - cfg.start_frame + 1
+
+                    if self.token.cancelled:
+                        log.warning(f"Capture cancelled at frame {current}.")
+                        break
+                    if proc.poll() is not None:
+                        log.error(f"FFmpeg terminated prematurely at frame {current}.")
+                        break
+
+                    try:
+                        frame = self._backend.request_frame(current)
+                    except Exception as frame_err:
+                        log.warning(f"Frame {current} skipped — {frame_err}")
+                        continue
+
+                    writer.put(current, frame)
+                    self._emit_progress(done, cfg.frame_count)
+                    if preview and self._is_readable(preview, cfg.preview_after, cfg.frame_rate):
+                        self.on_preview_ready.emit(preview.output_path)
+                        preview = None
+                    yield current
+                else:
+                    completed = True
+            finally:
+                writer.close()
+
+        completed = completed and proc.returncode == 0
+        # Shorter than the first fragment, the closed file is readable.
+        if preview and completed:
+            self.on_preview_ready.emit(preview.output_path)
+        return completed
+
+    def frames(self, start_frame: int | None = None, end_frame: int | None = None,
+               prefetch: int = 2, copy: bool = False) -> Iterator[tuple[int, np.ndarray]]:
+        # Pooled buffers are only valid until the next frame is requested, unless copied.
+        start_frame, end_frame = self._frame_range(start_frame, end_frame)
+        total = end_frame - start_frame + 1
+        with self._session(prefetch + 2, start_frame, end_frame):
+            requests = self._requests(start_frame, end_frame, prefetch)
+            try:
+                for current, request in requests:
+                    try:
+                        buffer = request.result() if isinstance(request, Future) else request
+                    except Exception as frame_err:
+                        log.warning(f"Frame {current} skipped — {frame_err}")
+                        continue
+
+                    if copy:
+                        image = np.array(self._top_down(buffer))
+                        self._backend.release_frame(buffer)
+                        yield current, image
+                    else:
+                        try:
+                            yield current, self._top_down(buffer)
+                        finally:
+                            self._backend.release_frame(buffer)
+                    self._emit_progress(current - start_frame + 1, total)
+            finally:
+                requests.close()
+
+    async def aframes(self, start_frame: int | None = None, end_frame: int | None = None,
+                      prefetch: int = 2, copy: bool = False) -> AsyncIterator[tuple[int, np.ndarray]]:
+        # Maya is driven from the event loop thread, which must be the main thread.
+        # Other tasks run between frames, so the session is never isolated.
+        start_frame, end_frame = self._frame_range(start_frame, end_frame)
+        total = end_frame - start_frame + 1
+        with self._session(prefetch + 2, start_frame, end_frame, isolate=False):
+            requests = self._requests(start_frame, end_frame, prefetch)
+            try:
+                for current, request in requests:
+                    try:
+                        if isinstance(request, Future):
+                            buffer = await asyncio.wrap_future(request)
+                        else:
+                            buffer = request
+                            await asyncio.sleep(0)
+                    except Exception as frame_err:
+                        log.warning(f"Frame {current} skipped — {frame_err}")
+                        continue
+
+                    if copy:
+                        image = np.array(self._top_down(buffer))
+                        self._backend.release_frame(buffer)
+                        yield current, image
+                    else:
+                        try:
+                            yield current, self._top_down(buffer)
+                        finally:
+                            self._backend.release_frame(buffer)
+                    self._emit_progress(current - start_frame + 1, total)
+            finally:
+                requests.close()
+
+    def _emit_progress(self, done: int, total: int) -> None:
+        # Frames done, frame total, capture fps and remaining seconds.
+        elapsed = self.profiler.elapsed
+        fps = done / elapsed if elapsed else 0.0
+        eta = (total - done) / fps if fps else 0.0
+        self.on_progress.emit(done, total, fps, eta)
+
+    def cancel(self) -> None:
+        self.token.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    @contextmanager
+    def _session(self, pool_size: int, start_frame: int, end_frame: int, isolate: bool | None = None):
+        cfg = self._config_cfg
+        try:
+            self._backend.allocate_pool(pool_size)
+            self._backend.profiler = self.profiler
+            self._backend.update_time = not (cfg.evaluation and cfg.evaluation.light_time_change)
+            self._backend.setup()
+            self.profiler.start()
+            with context.IsolateCapture(self._view_cfg, cfg.isolate if isolate is None else isolate), \
+                    context.PlaybackEvaluation(cfg.evaluation, start_frame, end_frame), \
+                    context.SetEditorFlag(self._view_cfg):
+                yield
         finally:
             self._backend.teardown()
+            self.profiler.stop()
 
-        log.debug(f"Capture complete — {cfg.output_path}")
+    def _requests(self, start_frame: int, end_frame: int, prefetch: int):
+        # Keeps up to prefetch frames requested ahead, the pool bounds what the consumer can hold.
+        pending = deque()
+        current = start_frame
+        try:
+            while not self.token.cancelled and (pending or current <= end_frame):
+                while current <= end_frame and len(pending) < max(1, prefetch):
+                    try:
+                        pending.append((current, self._backend.request_frame(current)))
+                    except Exception as frame_err:
+                        log.warning(f"Frame {current} skipped — {frame_err}")
+                    current += 1
+                if pending:
+                    yield pending.popleft()
+        finally:
+            for _, request in pending:
+                if isinstance(request, Future):
+                    request.add_done_callback(self._release_future)
+                else:
+                    self._backend.release_frame(request)
+
+    def _release_future(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self._backend.release_frame(future.result())
+
+    def _top_down(self, buffer: np.ndarray) -> np.ndarray:
+        return buffer[::-1] if self._backend.BOTTOM_UP else buffer
+
+    def _frame_range(self, start_frame: int | None, end_frame: int | None) -> tuple[int, int]:
+        cfg = self._config_cfg
+        return (cfg.start_frame if start_frame is None else start_frame,
+                cfg.end_frame if end_frame is None else end_frame)
+
+    def _on_encoder_progress(self, frame: int, *args) -> None:
+        self._encoded = frame
+
+    def _is_readable(self, output: OutputConfig, frame_count: int, gop: int) -> bool:
+        if output.is_stream:
+            return self._encoded >= frame_count
+        # A fragment is only flushed when the next keyframe starts, one GOP after the frames it holds.
+        if self._encoded < frame_count + gop:
+            return False
+        if output.output_path.suffix.lower() in (".mp4", ".mov", ".m4v"):
+            return io_utils.has_movie_fragment(output.output_path)
+        try:
+            return output.output_path.stat().st_size > 0
+        except OSError:
+            return False
+
+    def _checkpoint(self) -> Checkpoint | None:
+        cfg = self._config_cfg
+        if not cfg.checkpoint_frames:
+            return None
+        primary = cfg.outputs[0]
+        if len(cfg.outputs) > 1 or primary.is_stream or primary.is_image_sequence:
+            log.warning("Checkpointed captures need a single movie output, capture in one pass.")
+            return None
+
+        return Checkpoint(cfg, self._view_cfg)
+
+    def _offscreen_view_config(self, view_cfg: ViewConfig) -> ViewConfig:
+        cfg = self._config_cfg
+        if not view_cfg.view:
+            log.warning("Offscreen capture needs an interactive session, capture the source view.")
+            return view_cfg
+
+        width = int(cfg.width or view_cfg.width)
+        height = int(cfg.height or view_cfg.height)
+        camera = maya_ui.get_view_camera(view_cfg.view)
+        panel = maya_ui.get_capture_panel(width, height)
+        maya_ui.match_editor(view_cfg.panel, panel, camera)
+
+        offscreen_cfg = ViewConfig(view=maya_ui.get_view(panel), camera=camera, flags=view_cfg.flags)
+        if (offscreen_cfg.width, offscreen_cfg.height) != (width, height):
+            log.warning(f"Offscreen panel is {offscreen_cfg.width}x{offscreen_cfg.height}, "
+                        f"requested {width}x{height}.")
+
+        return offscreen_cfg
+
+    def _frame_cache(self) -> FrameCache:
+        return FrameCache(self._config_cfg.cache_path, self._config_cfg.cache_max_bytes)
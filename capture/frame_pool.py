@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from queue import Empty, Queue
+
+import numpy as np
+
+
+class FramePool:
+
+    def __init__(self, width: int, height: int, size: int = 8, channels: int = 4, timeout: float = 60.0):
+        if size < 1:
+            raise ValueError(f"Frame pool size must be at least 1, got {size}")
+
+        self._shape = (int(height), int(width), channels)
+        self._timeout = timeout
+        self._buffers = [np.empty(self._shape, dtype=np.uint8) for _ in range(size)]
+        self._owned = {id(buffer) for buffer in self._buffers}
+        self._free: Queue = Queue()
+        for buffer in self._buffers:
+            self._free.put(buffer)
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    @property
+    def shape(self) -> tuple:
+        return self._shape
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self._buffers)
+
+    @property
+    def available(self) -> int:
+        return self._free.qsize()
+
+    def acquire(self) -> np.ndarray:
+        # Blocks until the encoder hands a buffer back.
+        try:
+            return self._free.get(timeout=self._timeout)
+        except Empty:
+            raise RuntimeError(f"No frame buffer released after {self._timeout}s, "
+                               f"all {len(self)} buffers are still in use.")
+
+    def release(self, buffer: np.ndarray) -> None:
+        if id(buffer) in self._owned:
+            self._free.put(buffer)
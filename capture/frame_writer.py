@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from queue import Queue
+from threading import Thread
+from typing import Callable
+
+import numpy as np
+
+from ..core.logger import log
+from ..core.profiler import CaptureProfiler
+from ..capture.encoders.base import Encoder
+
+
+class FrameWriter:
+
+    _STOP = object()
+
+    def __init__(self, proc: Encoder, queue_size: int = 8,
+                 release: Callable[[np.ndarray], None] | None = None,
+                 profiler: CaptureProfiler | None = None):
+        self._proc = proc
+        self._release = release
+        self._profiler = profiler if profiler else CaptureProfiler(enabled=False)
+        self._queue_size = queue_size
+        self._queue: Queue = Queue(maxsize=max(queue_size, 1))
+        self._thread: Thread | None = None
+        self._error: Exception | None = None
+        self.written = 0
+
+    @property
+    def is_pipelined(self) -> bool:
+        return self._queue_size > 0
+
+    @property
+    def error(self) -> Exception | None:
+        return self._error
+
+    def start(self) -> None:
+        if not self.is_pipelined or self._thread is not None:
+            return
+        self._thread = Thread(target=self._drain, name="FrameWriter", daemon=True)
+        self._thread.start()
+
+    def put(self, frame: int, buffer: np.ndarray | Future) -> None:
+        if self._error is not None:
+            self._recycle(buffer)
+            raise RuntimeError(f"Frame writer stopped — {self._error}") from self._error
+
+        if self.is_pipelined:
+            # Blocks while the queue is full, so the capture never outruns the encoder.
+            self._queue.put((frame, buffer))
+        else:
+            self._write(frame, buffer)
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            # Keep consuming after a failure so a blocked producer is released.
+            if self._error is None:
+                self._write(*item)
+            else:
+                self._recycle(item[1])
+
+    def _write(self, frame: int, buffer: np.ndarray | Future) -> None:
+        if isinstance(buffer, Future):
+            try:
+                buffer = buffer.result()
+            except Exception as frame_err:
+                log.warning(f"Frame {frame} skipped — {frame_err}")
+                return
+
+        try:
+            data = buffer
+            if self._proc.converts:
+                with self._profiler.stage("wire", frame):
+                    data = self._proc.convert(buffer)
+            with self._profiler.stage("write", frame):
+                self._proc.write(data)
+            self.written += 1
+        except Exception as e:
+            self._error = e
+            log.error(f"Failed to write frame {frame} — {e}")
+        finally:
+            self._recycle(buffer)
+
+    def _recycle(self, buffer: np.ndarray | Future) -> None:
+        if isinstance(buffer, Future):
+            # Pending frames hand their buffer back once decoded.
+            buffer.add_done_callback(self._recycle_future)
+            return
+        if self._release is not None:
+            self._release(buffer)
+
+    def _recycle_future(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self._recycle(future.result())
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..core.logger import log
+
+
+# Pixel formats sent over the encoder pipe, bytes per pixel.
+WIRE_FORMATS = {"rgba": 4.0,
+                "rgb24": 3.0,
+                "yuv422p": 2.0,
+                "yuv420p": 1.5}
+
+
+def wire_format_for(requested: str, width: int, height: int) -> str:
+    if requested not in WIRE_FORMATS:
+        raise ValueError(f"Wire format must be one of {', '.join(WIRE_FORMATS)}, got {requested}")
+    # Chroma planes are built from whole 2x2 (or 2x1) blocks.
+    if requested == "yuv420p" and (width % 2 or height % 2):
+        log.warning(f"yuv420p needs an even size, {width}x{height} is sent as rgb24.")
+        return "rgb24"
+    if requested == "yuv422p" and width % 2:
+        log.warning(f"yuv422p needs an even width, {width}x{height} is sent as rgb24.")
+        return "rgb24"
+    return requested
+
+
+class WireConverter:
+
+    BAND_ROWS = 64
+
+    def __init__(self, width: int, height: int, wire_format: str = "rgba"):
+        self._width = int(width)
+        self._height = int(height)
+        self._format = wire_format
+        self._out: np.ndarray | None = None
+        self._tmp: dict[str, np.ndarray] = {}
+        if wire_format != "rgba":
+            self._allocate()
+
+    @property
+    def wire_format(self) -> str:
+        return self._format
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._width * self._height * WIRE_FORMATS[self._format])
+
+    def convert(self, buffer: np.ndarray) -> np.ndarray:
+        # Returns a buffer reused by the next call, write it before converting again.
+        if self._format == "rgba":
+            return buffer
+        if self._format == "rgb24":
+            for start in range(0, self._height, self.BAND_ROWS):
+                np.copyto(self._out[start:start + self.BAND_ROWS], buffer[start:start + self.BAND_ROWS, :, :3])
+            return self._out
+        return self._to_yuv(buffer)
+
+    def _allocate(self) -> None:
+        width, height = self._width, self._height
+        if self._format == "rgb24":
+            self._out = np.empty((height, width, 3), dtype=np.uint8)
+            return
+
+        chroma_h = height // 2 if self._format == "yuv420p" else height
+        chroma_w = width // 2
+        self._out = np.empty(width * height + 2 * chroma_w * chroma_h, dtype=np.uint8)
+        # Temporaries cover one band of rows so the working set stays in cache.
+        band = min(self.BAND_ROWS, height)
+        chroma_band = band // 2 if self._format == "yuv420p" else band
+        self._tmp = {"y": np.empty((band, width), dtype=np.uint16),
+                     "c": np.empty((band, width), dtype=np.uint16),
+                     "rgb": np.empty((3, chroma_band, chroma_w), dtype=np.uint16),
+                     "uv": np.empty((chroma_band, chroma_w), dtype=np.uint16),
+                     "uv_tmp": np.empty((chroma_band, chroma_w), dtype=np.uint16)}
+
+    def _to_yuv(self, buffer: np.ndarray) -> np.ndarray:
+        width, height = self._width, self._height
+        y_size = width * height
+        chroma_h = height // 2 if self._format == "yuv420p" else height
+        chroma_size = chroma_h * (width // 2)
+        y_plane = self._out[:y_size].reshape(height, width)
+        u_plane = self._out[y_size:y_size + chroma_size].reshape(chroma_h, width // 2)
+        v_plane = self._out[y_size + chroma_size:].reshape(chroma_h, width // 2)
+
+        ratio = 2 if self._format == "yuv420p" else 1
+        for start in range(0, height, self.BAND_ROWS):
+            end = min(start + self.BAND_ROWS, height)
+            self._band_to_yuv(buffer[start:end], y_plane[start:end],
+                              u_plane[start // ratio:end // ratio], v_plane[start // ratio:end // ratio])
+
+        return self._out
+
+    def _band_to_yuv(self, rgba: np.ndarray, y_plane: np.ndarray, u_plane: np.ndarray, v_plane: np.ndarray) -> None:
+        # BT.601 limited range in 8-bit fixed point, what swscale applies to the rgba input by default.
+        rows, width = y_plane.shape
+        half = width // 2
+        y, c = self._tmp["y"][:rows], self._tmp["c"][:rows]
+        r, g, b = rgba[..., 0], rgba[..., 1], rgba[..., 2]
+        np.multiply(r, 66, out=y, dtype=np.uint16)
+        np.multiply(g, 129, out=c, dtype=np.uint16)
+        y += c
+        np.multiply(b, 25, out=c, dtype=np.uint16)
+        y += c
+        y += 128
+        y >>= 8
+        y += 16
+        np.copyto(y_plane, y, casting="unsafe")
+
+        # Average RGB over each chroma block first, a quarter (or half) of the pixels to convert.
+        chroma_rows = u_plane.shape[0]
+        rgb = self._tmp["rgb"][:, :chroma_rows]
+        for i in range(3):
+            channel = rgba[..., i]
+            block = rgb[i]
+            np.add(channel[:, 0::2], channel[:, 1::2], out=c[:, :half], dtype=np.uint16)
+            if self._format == "yuv420p":
+                np.add(c[0::2, :half], c[1::2, :half], out=block)
+                block += 2
+                block >>= 2
+            else:
+                np.add(c[:, :half], 1, out=block)
+                block >>= 1
+
+        # Offset by 128 << 8 first so every partial sum stays positive in uint16.
+        chroma, tmp = self._tmp["uv"][:chroma_rows], self._tmp["uv_tmp"][:chroma_rows]
+        np.multiply(rgb[2], 112, out=chroma)
+        chroma += 32896
+        np.multiply(rgb[0], 38, out=tmp)
+        chroma -= tmp
+        np.multiply(rgb[1], 74, out=tmp)
+        chroma -= tmp
+        chroma >>= 8
+        np.copyto(u_plane, chroma, casting="unsafe")
+
+        np.multiply(rgb[0], 112, out=chroma)
+        chroma += 32896
+        np.multiply(rgb[1], 94, out=tmp)
+        chroma -= tmp
+        np.multiply(rgb[2], 18, out=tmp)
+        chroma -= tmp
+        chroma >>= 8
+        np.copyto(v_plane, chroma, casting="unsafe")
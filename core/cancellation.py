@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from threading import Event
+
+from ..core import signal
+
+
+class CancellationToken:
+
+    def __init__(self):
+        self._event = Event()
+        self.on_cancelled = signal.Signal()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(cancelled: {self.cancelled})"
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        # Safe from any thread or signal handler, honoured between frames.
+        if not self._event.is_set():
+            self._event.set()
+            self.on_cancelled.emit()
+
+    def reset(self) -> None:
+        self._event.clear()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._event.wait(timeout)
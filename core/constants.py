@@ -1,12 +1,24 @@
 from pathlib import Path
+import tempfile
 
 
 ROOT_PATH = Path(__file__).parent.parent
 SETTINGS_PATH = ROOT_PATH / "settings.ini"
 CLOSE_ICON_PATH = ROOT_PATH / "icons" / "close.svg"
 SETTINGS_ICON_PATH = ROOT_PATH / "icons" / "settings.svg"
+CACHE_PATH = Path(tempfile.gettempdir()) / "maya_playblast" / "frames"
+CACHE_MAX_BYTES = 20 * 1024 ** 3
 
 OVERRIDE_NAME = "PlayblastOffscreenOverride"
+CAPTURE_WINDOW_NAME = "PlayblastCaptureWindow"
+FASTEST_ENCODER = "fastest"
+# Network outputs and the muxer streamed to each protocol.
+STREAM_FORMATS = {"udp": "mpegts",
+                  "tcp": "mpegts",
+                  "srt": "mpegts",
+                  "rtp": "rtp_mpegts",
+                  "rtmp": "flv",
+                  "http": "mp4"}
 
 
 MUXERS = [('mp4', 'MP4 (MPEG-4 Part 14)'),
@@ -108,7 +120,8 @@ VIDEO_ENCODERS = [('libx264', 'libx264 H.264 / AVC / MPEG-4 AVC / MPEG-4 part 10
                   ('asv1', 'ASUS V1'),
                   ('wrapped_avframe', 'AVFrame to AVPacket passthrough'),
                   ('a64multi', 'Multicolor charset for Commodore 64'),
-                  ('a64multi5', 'Multicolor charset for Commodore 64 (5th color)')]
+                  ('a64multi5', 'Multicolor charset for Commodore 64 (5th color)'),
+                  (FASTEST_ENCODER, 'Fastest available H.264 encoder (hardware when supported)')]
 
 IMAGE_ENCODERS = [('png', 'PNG (Portable Network Graphics)'),
                   ('gif', 'GIF (Graphics Interchange Format)'),
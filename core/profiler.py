@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+import csv
+import json
+import time
+
+from ..core.logger import log
+
+
+class CaptureProfiler:
+
+    # time: scene evaluation, readback: draw and read pixels, convert: copy/decode,
+    # wire: conversion to the encoder's pixel format, write: pipe write
+    STAGES = ("time", "readback", "convert", "wire", "write")
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = Lock()
+        self._frames: dict[int, dict[str, float]] = defaultdict(dict)
+        self._encoder: list[dict[str, float]] = []
+        self._start: float | None = None
+        self._end: float | None = None
+
+    def start(self) -> None:
+        self._start = time.perf_counter()
+        self._end = None
+
+    def stop(self) -> None:
+        self._end = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        if self._start is None:
+            return 0.0
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._frames)
+
+    @contextmanager
+    def stage(self, name: str, frame: int):
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, frame, time.perf_counter() - start)
+
+    def record(self, name: str, frame: int, duration: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            stages = self._frames[frame]
+            stages[name] = stages.get(name, 0.0) + duration
+
+    def record_encoder(self, frame: int, fps: float, speed: float | None = None) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._encoder.append({"time": self.elapsed, "frame": frame, "fps": fps, "speed": speed})
+
+    def stage_durations(self, name: str) -> list[float]:
+        with self._lock:
+            return [x[name] for x in self._frames.values() if name in x]
+
+    def summary(self) -> dict:
+        stages = {}
+        names = list(self.STAGES) + sorted({k for x in self._frames.values() for k in x} - set(self.STAGES))
+        for name in names:
+            durations = sorted(self.stage_durations(name))
+            if not durations:
+                continue
+            stages[name] = {"count": len(durations),
+                            "mean": sum(durations) / len(durations),
+                            "p95": durations[int(0.95 * (len(durations) - 1))],
+                            "max": durations[-1],
+                            "total": sum(durations)}
+
+        elapsed = self.elapsed
+        encoder_fps = [x["fps"] for x in self._encoder if x["fps"]]
+        return {"frames": self.frame_count,
+                "elapsed": elapsed,
+                "fps": self.frame_count / elapsed if elapsed else 0.0,
+                "encoder_fps": encoder_fps[-1] if encoder_fps else None,
+                "stages": stages}
+
+    def log_summary(self) -> None:
+        summary = self.summary()
+        lines = [f"{summary['frames']} frames in {summary['elapsed']:.2f}s — {summary['fps']:.1f} fps"]
+        if summary["encoder_fps"]:
+            lines[0] += f", encoder {summary['encoder_fps']:.1f} fps"
+        for name, stats in summary["stages"].items():
+            lines.append(f"\t{name:<10} mean {stats['mean'] * 1000:7.2f} ms | "
+                         f"p95 {stats['p95'] * 1000:7.2f} ms | max {stats['max'] * 1000:7.2f} ms")
+        log.info("Capture profile:\n" + "\n".join(lines))
+
+    def write_trace(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            frames = {frame: dict(stages) for frame, stages in sorted(self._frames.items())}
+            encoder = list(self._encoder)
+
+        if path.suffix.lower() == ".csv":
+            names = list(self.STAGES) + sorted({k for x in frames.values() for k in x} - set(self.STAGES))
+            with path.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame", *names])
+                for frame, stages in frames.items():
+                    writer.writerow([frame, *[stages.get(x, "") for x in names]])
+        else:
+            data = {"summary": self.summary(),
+                    "frames": [{"frame": frame, **stages} for frame, stages in frames.items()],
+                    "encoder": encoder}
+            path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+
+        return path
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+import re
+import subprocess
+
+from ..core.logger import log
+
+
+# Preferred order when looking for the fastest working H.264 encoder.
+FASTEST_ENCODERS = ["h264_nvenc", "h264_qsv", "h264_amf", "h264_videotoolbox", "h264_mf", "libx264"]
+FALLBACK_ENCODER = "libx264"
+
+_CRF_ENCODERS = {"libx264", "libx264rgb", "libx265", "libvpx", "libvpx-vp9", "libaom-av1", "libsvtav1"}
+_ENCODER_LINE = re.compile(r"^\s*([VAS])[F.][S.][X.][B.][D.]\s+(\S+)")
+_PIX_FMT_LINE = re.compile(r"^\s*([I.])([O.])[H.][P.][B.]\s+(\S+)")
+
+
+def _run(ffmpeg_path: str, args: list[str], timeout: float = 15.0) -> subprocess.CompletedProcess:
+    return subprocess.run([ffmpeg_path, "-hide_banner", *args],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          timeout=timeout)
+
+
+@lru_cache(maxsize=None)
+def get_encoders(ffmpeg_path: str | Path) -> frozenset[str]:
+    try:
+        result = _run(str(ffmpeg_path), ["-encoders"])
+    except Exception as e:
+        log.error(f"Failed to list ffmpeg encoders — {e}")
+        return frozenset()
+
+    encoders = set()
+    for line in result.stdout.decode(errors="replace").splitlines():
+        match = _ENCODER_LINE.match(line)
+        if match and match.group(1) == "V":
+            encoders.add(match.group(2))
+
+    return frozenset(encoders)
+
+
+@lru_cache(maxsize=None)
+def get_pix_fmts(ffmpeg_path: str | Path) -> frozenset[str]:
+    try:
+        result = _run(str(ffmpeg_path), ["-pix_fmts"])
+    except Exception as e:
+        log.error(f"Failed to list ffmpeg pixel formats — {e}")
+        return frozenset()
+
+    pix_fmts = set()
+    for line in result.stdout.decode(errors="replace").splitlines():
+        match = _PIX_FMT_LINE.match(line)
+        if match and match.group(2) == "O":
+            pix_fmts.add(match.group(3))
+
+    return frozenset(pix_fmts)
+
+
+@lru_cache(maxsize=None)
+def get_encoder_pix_fmts(ffmpeg_path: str | Path, codec: str) -> tuple[str, ...]:
+    try:
+        result = _run(str(ffmpeg_path), ["-h", f"encoder={codec}"])
+    except Exception as e:
+        log.error(f"Failed to query encoder {codec} — {e}")
+        return ()
+
+    for line in result.stdout.decode(errors="replace").splitlines():
+        if "Supported pixel formats:" in line:
+            return tuple(line.split(":", 1)[1].split())
+
+    return ()
+
+
+@lru_cache(maxsize=None)
+def encoder_works(ffmpeg_path: str | Path, codec: str) -> bool:
+    # Listed hardware encoders still fail without the matching GPU or driver.
+    if codec not in get_encoders(ffmpeg_path):
+        return False
+
+    pix_fmt = select_pix_fmt(ffmpeg_path, codec, "yuv420p")
+    args = ["-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+            "-frames:v", "1", "-c:v", codec]
+    if pix_fmt:
+        args += ["-pix_fmt", pix_fmt]
+    try:
+        result = _run(str(ffmpeg_path), args + ["-f", "null", "-"])
+    except Exception as e:
+        log.debug(f"Encoder {codec} probe failed — {e}")
+        return False
+
+    return result.returncode == 0
+
+
+def select_fastest_encoder(ffmpeg_path: str | Path) -> str:
+    for codec in FASTEST_ENCODERS:
+        if encoder_works(ffmpeg_path, codec):
+            log.debug(f"Fastest available encoder : {codec}")
+            return codec
+
+    return FALLBACK_ENCODER
+
+
+def resolve_encoder(ffmpeg_path: str | Path, codec: str) -> str:
+    encoders = get_encoders(ffmpeg_path)
+    # An empty list means the probe itself failed, trust the configuration.
+    if not encoders or (codec in encoders and (not is_hardware(codec) or encoder_works(ffmpeg_path, codec))):
+        return codec
+
+    fallback = select_fastest_encoder(ffmpeg_path)
+    log.warning(f"Encoder {codec} is not usable with {ffmpeg_path}, fallback on {fallback}.")
+
+    return fallback
+
+
+def select_pix_fmt(ffmpeg_path: str | Path, codec: str, requested: str | None) -> str | None:
+    supported = get_encoder_pix_fmts(ffmpeg_path, codec)
+    if not supported:
+        known = get_pix_fmts(ffmpeg_path)
+        if requested and known and requested not in known:
+            log.warning(f"Pixel format {requested} unknown to {ffmpeg_path}, let ffmpeg choose.")
+            return None
+        return requested
+
+    return pick_pix_fmt(supported, requested)
+
+
+def pick_pix_fmt(supported: tuple[str, ...], requested: str | None) -> str:
+    # JPEG based encoders list full range formats first, limited range only works in unofficial mode.
+    full_range = f"yuvj{requested[3:]}" if requested and requested.startswith("yuv") else None
+    if full_range in supported and (requested not in supported or
+                                    supported.index(full_range) < supported.index(requested)):
+        return full_range
+    if requested in supported:
+        return requested
+
+    # Step down the chroma resolution from the request until the encoder accepts it,
+    # a higher bit depth with the same chroma (yuv444p10le for yuv444p) comes first.
+    order = ("yuv444p", "yuv422p", "yuv420p", "nv12")
+    start = order.index(requested) if requested in order else 0
+    for candidate in order[start:]:
+        if candidate in supported:
+            return candidate
+        deeper = [x for x in supported if x.startswith(candidate)]
+        if deeper:
+            return deeper[0]
+
+    return supported[0]
+
+
+def is_hardware(codec: str) -> bool:
+    return codec.endswith(("_nvenc", "_qsv", "_amf", "_mf", "_videotoolbox", "_vaapi"))
+
+
+def rate_control_args(codec: str, crf: int | None, fast: bool = False, low_latency: bool = False) -> list[str]:
+    # Low latency implies the fast presets, plus the encoder specific no-lookahead switches.
+    args = _quality_args(codec, crf, fast or low_latency, low_latency)
+    if low_latency:
+        args += _low_latency_args(codec)
+
+    return args
+
+
+def keyframe_args(frame_rate: int, low_latency: bool = False, progressive: bool = False) -> list[str]:
+    args = []
+    if low_latency or progressive:
+        # One keyframe, hence one fragment, per second so readers joining late start quickly.
+        args += ["-g", f"{frame_rate}"]
+    if low_latency:
+        args += ["-bf", "0"]
+
+    return args
+
+
+def progressive_args(suffix: str) -> list[str]:
+    suffix = suffix.lower()
+    if suffix in (".mp4", ".mov", ".m4v"):
+        return ["-movflags", "frag_keyframe+empty_moov+default_base_moof", "-flush_packets", "1"]
+    if suffix in (".mkv", ".webm"):
+        # Matroska is readable mid-write once clusters are flushed.
+        return ["-cluster_time_limit", "1000", "-flush_packets", "1"]
+
+    return []
+
+
+def to_options(args: list[str]) -> dict[str, str]:
+    # -key value pairs as libav options.
+    return {key.lstrip("-"): value for key, value in zip(args[::2], args[1::2])}
+
+
+def _low_latency_args(codec: str) -> list[str]:
+    if codec.endswith("_nvenc"):
+        return ["-zerolatency", "1", "-rc-lookahead", "0"]
+    if codec.endswith("_qsv"):
+        return ["-async_depth", "1"]
+    if codec.endswith("_amf"):
+        return ["-usage", "lowlatency"]
+    if codec.endswith("_videotoolbox"):
+        return ["-realtime", "1"]
+
+    return []
+
+
+def _quality_args(codec: str, crf: int | None, fast: bool, low_latency: bool) -> list[str]:
+    if crf is None:
+        if low_latency and codec.startswith("libx26"):
+            return ["-preset", "veryfast", "-tune", "zerolatency"]
+        return []
+
+    if codec.endswith("_nvenc"):
+        args = ["-rc", "vbr", "-cq", f"{crf}", "-b:v", "0"]
+        return args + ["-preset", "p1" if fast else "p4"]
+    if codec.endswith("_qsv"):
+        args = ["-global_quality", f"{crf}"]
+        return args + ["-preset", "veryfast"] if fast else args
+    if codec.endswith("_amf"):
+        args = ["-rc", "cqp", "-qp_i", f"{crf}", "-qp_p", f"{crf}"]
+        return args + ["-quality", "speed"] if fast else args
+    if codec.endswith("_videotoolbox"):
+        return ["-q:v", f"{max(1, 100 - crf * 2)}"]
+    if codec.endswith("_mf"):
+        return ["-rate_control", "quality", "-quality", f"{max(1, 100 - crf * 2)}"]
+    if codec in ("libvpx", "libvpx-vp9", "libaom-av1"):
+        return ["-crf", f"{crf}", "-b:v", "0"]
+    if codec in _CRF_ENCODERS:
+        args = ["-crf", f"{crf}"]
+        if fast and codec.startswith("libx26"):
+            args += ["-preset", "veryfast", "-tune", "zerolatency" if low_latency else "animation"]
+        return args
+
+    return []
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import deque
+from subprocess import Popen
+from threading import Event, Lock, Thread
+import time
+
+from ..core import signal
+from ..core.logger import log
+from ..core.profiler import CaptureProfiler
+
+
+# ffmpeg's http server reads back after its last chunk, a receiver already gone fails the close.
+_LISTEN_CLOSE_ERRORS = ("URL read error: End of file", "Error closing file: End of file")
+
+
+class FFmpegSupervisor:
+
+    def __init__(self, proc: Popen, stall_timeout: float | None = 60.0,
+                 stderr_lines: int = 200, profiler: CaptureProfiler | None = None, listening: bool = False):
+        self._proc = proc
+        self._listening = listening
+        self._returncode: int | None = None
+        self._stall_timeout = stall_timeout
+        self._profiler = profiler if profiler else CaptureProfiler(enabled=False)
+        # Only the tail of the diagnostics is kept, long captures never grow it.
+        self._stderr: deque[str] = deque(maxlen=stderr_lines)
+        self._lock = Lock()
+        self._write_start: float | None = None
+        self._closed = Event()
+        # ffmpeg opens its outputs before the first progress block, http outputs wait there for a receiver.
+        self._running = Event()
+        self._threads: list[Thread] = []
+        self.stalled = False
+        self.finished = False
+        self.progress: dict[str, str] = {}
+        # frame, fps, bitrate (kbit/s), speed
+        self.on_progress = signal.Signal()
+
+    @property
+    def returncode(self) -> int | None:
+        return self._returncode if self._returncode is not None else self._proc.returncode
+
+    @property
+    def stderr(self) -> list[str]:
+        return list(self._stderr)
+
+    def start(self) -> FFmpegSupervisor:
+        targets = [self._drain_stderr, self._watch]
+        if self._proc.stdout is not None:
+            targets.append(self._read_progress)
+        else:
+            self._running.set()
+        for target in targets:
+            thread = Thread(target=target, name=f"FFmpeg{target.__name__}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        return self
+
+    def poll(self) -> int | None:
+        return self._proc.poll()
+
+    def write(self, data) -> None:
+        with self._lock:
+            self._write_start = time.monotonic()
+        try:
+            self._proc.stdin.write(data)
+        finally:
+            with self._lock:
+                self._write_start = None
+
+    def close(self, timeout: float = 30.0) -> int | None:
+        try:
+            self._proc.stdin.close()
+        except Exception as e:
+            log.warning(f"Failed to close stdin: {e}")
+
+        try:
+            self._proc.wait(timeout=timeout)
+        except Exception:
+            log.error("FFmpeg did not terminate in time, killing process.")
+            self._proc.kill()
+            self._proc.wait()
+        self._closed.set()
+        for thread in self._threads:
+            thread.join(timeout=5.0)
+
+        returncode = self._proc.returncode
+        if returncode != 0 and self._listening and self.finished and self._receiver_left():
+            log.warning("Receiver disconnected once the stream ended, ffmpeg failed its http close.")
+            returncode = 0
+        self._returncode = returncode
+
+        # Warnings on a successful encode are noise, the tail only matters on failure.
+        if returncode != 0:
+            log.error(f"FFmpeg exited with code {returncode}:\n" + "\n".join(self._stderr))
+        elif self._stderr:
+            log.debug("ffmpeg stderr:\n" + "\n".join(self._stderr))
+
+        return returncode
+
+    def _receiver_left(self) -> bool:
+        errors = [x for x in self._stderr if "error" in x.lower()]
+        return bool(errors) and all(x.endswith(_LISTEN_CLOSE_ERRORS) for x in errors)
+
+    def _watch(self) -> None:
+        # A blocked pipe write means ffmpeg stopped reading, kill it so the writer fails instead of hanging.
+        while not self._closed.wait(0.5):
+            if self._stall_timeout is None or not self._running.is_set():
+                continue
+            with self._lock:
+                blocked = time.monotonic() - self._write_start if self._write_start is not None else 0.0
+            if blocked > self._stall_timeout:
+                log.error(f"FFmpeg stalled, no frame consumed for {blocked:.0f}s, killing process.")
+                self.stalled = True
+                self._proc.kill()
+                break
+
+    def _drain_stderr(self) -> None:
+        for raw in iter(self._proc.stderr.readline, b""):
+            line = raw.decode(errors="replace").rstrip()
+            if line:
+                self._stderr.append(line)
+
+    def _read_progress(self) -> None:
+        # -progress blocks of key=value lines, each terminated by progress=continue|end.
+        block = {}
+        for raw in iter(self._proc.stdout.readline, b""):
+            key, _, value = raw.decode(errors="replace").strip().partition("=")
+            if key != "progress":
+                block[key] = value.strip()
+                continue
+
+            self.progress = block
+            self.finished = value.strip() == "end"
+            self._running.set()
+            frame = _to_number(block.get("frame"), int)
+            fps = _to_number(block.get("fps"))
+            bitrate = _to_number(block.get("bitrate", "").replace("kbits/s", ""))
+            speed = _to_number(block.get("speed", "").rstrip("x"))
+            if frame is not None:
+                self._profiler.record_encoder(frame, fps or 0.0, speed)
+                self.on_progress.emit(frame, fps, bitrate, speed)
+            block = {}
+
+
+def _to_number(value: str | None, cast=float):
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
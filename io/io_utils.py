@@ -3,11 +3,13 @@ from __future__ import annotations
 from pathlib import Path
 import platform
 import shutil
+import struct
 import subprocess
 import sys
 from importlib import import_module
 
 from ..core.logger import log
+from ..core.constants import STREAM_FORMATS
 
 
 def get_platform() -> str | None:
@@ -28,6 +30,36 @@ def increment_file_path(path: str | Path) -> Path:
     return path
 
 
+def is_stream_url(path: str | Path) -> bool:
+    if not isinstance(path, str) or "://" not in path:
+        return False
+    return path.split("://", 1)[0].lower() in STREAM_FORMATS
+
+
+def has_movie_fragment(path: str | Path) -> bool:
+    # Walks the top-level MP4 boxes, an empty_moov file has no media until the first moof.
+    try:
+        with open(path, "rb") as f:
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return False
+                size, kind = struct.unpack(">I4s", header)
+                if kind == b"moof":
+                    return True
+                if size == 1:
+                    large = f.read(8)
+                    if len(large) < 8:
+                        return False
+                    size = struct.unpack(">Q", large)[0] - 8
+                # 0 runs to the end of the file, anything below a header is corrupt.
+                if size < 8:
+                    return False
+                f.seek(size - 8, 1)
+    except OSError:
+        return False
+
+
 def check_directory(path: str | Path, build: bool = True) -> bool:
     if isinstance(path, str):
         path = Path(path)
@@ -51,6 +83,15 @@ def search_exe(exe_name: str) -> Path | None:
     return None
 
 
+def get_mayapy() -> Path:
+    executable = Path(sys.executable)
+    if executable.stem.lower() == "mayapy":
+        return executable
+    name = "mayapy.exe" if get_platform() == "windows" else "mayapy"
+
+    return executable.parent / name
+
+
 def install_module(module_name: str, package_name: str | None = None) -> bool:
     package = package_name or module_name
 
@@ -61,7 +102,7 @@ def install_module(module_name: str, package_name: str | None = None) -> bool:
     log.debug(f"Install '{package}' with pip...")
 
     try:
-        maya_py = Path(sys.executable).parent / "mayapy.exe"
+        maya_py = get_mayapy()
         result = subprocess.run([str(maya_py), "-m", "pip", "install", package],
                                 stdout=subprocess.PIPE,
                                 stderr=subprocess.PIPE,
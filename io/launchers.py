@@ -3,15 +3,18 @@ from pathlib import Path
 import subprocess
 
 from ..core.logger import log
+from ..core.constants import FASTEST_ENCODER, STREAM_FORMATS
+from ..io import ffmpeg_probe, io_utils
 from ..core.settings import Settings
-from ..capture.config import CaptureConfig, ViewConfig
+from ..capture.config import CaptureConfig, OutputConfig, ViewConfig
 
 
 
 def open_player(path: str | Path):
-    if isinstance(path, str):
+    # Players open network streams as they would a file.
+    if isinstance(path, str) and not io_utils.is_stream_url(path):
         path = Path(path)
-    if not path.exists():
+    if isinstance(path, Path) and not path.exists():
         raise RuntimeError(f"Path {path} does not exists !")
 
     settings = Settings()
@@ -30,7 +33,7 @@ def open_player(path: str | Path):
         raise RuntimeError(f"Failed  to read {path} !\n\t{e}") from e
 
 
-def ffmpeg_capture(config: CaptureConfig, view_cfg: ViewConfig):
+def get_ffmpeg_path() -> Path:
     settings = Settings()
     ffmpeg_path = settings.get_ffmpeg()
     if not ffmpeg_path:
@@ -38,17 +41,145 @@ def ffmpeg_capture(config: CaptureConfig, view_cfg: ViewConfig):
     if not ffmpeg_path.exists():
         raise RuntimeError(f"FFmpeg path {ffmpeg_path} does not exist. Please check your settings.")
 
+    return ffmpeg_path
+
+
+def ffmpeg_capture(config: CaptureConfig, view_cfg: ViewConfig, vflip: bool = False, wire_format: str = "rgba"):
+    ffmpeg_path = get_ffmpeg_path()
+
+    # Structured progress on stdout, stderr only carries diagnostics.
     proc_cmd = [str(ffmpeg_path),
                 '-y',
+                '-hide_banner',
+                '-nostats',
+                '-progress', 'pipe:1',
                 '-f', 'rawvideo',
                 '-vcodec', 'rawvideo',
-                '-pix_fmt', 'rgba',
+                '-pix_fmt', wire_format,
                 '-s', f'{view_cfg.width}x{view_cfg.height}',
                 '-framerate', f'{config.frame_rate}',
-                '-i', '-',
-                '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
-                '-c:v', config.codec, '-crf', f'{config.crf}',
-                '-pix_fmt', 'yuv444p',
-                str(config.output_path)]
+                '-i', '-']
+    # Every output reads the same decoded input, frames cross the pipe once.
+    for output in config.outputs:
+        if not output.is_stream:
+            io_utils.check_directory(output.output_path, build=True)
+        proc_cmd += _output_args(ffmpeg_path, output, vflip, config.start_frame, config.frame_rate)
+
+    return subprocess.Popen(proc_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def _output_args(ffmpeg_path: Path, output: OutputConfig,
+                 vflip: bool = False, start_number: int = 0, frame_rate: int = 24) -> list[str]:
+    filters = ['pad=ceil(iw/2)*2:ceil(ih/2)*2']
+    if vflip:
+        filters.insert(0, 'vflip')
+    if output.scale != 1.0:
+        filters.append(f'scale=trunc(iw*{output.scale}/2)*2:trunc(ih*{output.scale}/2)*2')
+
+    if output.codec == FASTEST_ENCODER:
+        codec = ffmpeg_probe.select_fastest_encoder(ffmpeg_path)
+    else:
+        codec = ffmpeg_probe.resolve_encoder(ffmpeg_path, output.codec)
+    # A fallback replaces a fast hardware encoder, keep its speed with the tuned presets.
+    fast = codec != output.codec
+    # Review stations decode 4:2:0 in hardware, 4:4:4 streams often do not play live.
+    pix_fmt = ffmpeg_probe.select_pix_fmt(ffmpeg_path, codec, "yuv420p" if output.is_stream else output.pix_fmt)
+
+    args = ['-vf', ','.join(filters),
+            '-c:v', codec]
+    args += ffmpeg_probe.rate_control_args(codec, output.crf, fast=fast, low_latency=bool(output.low_latency))
+    args += ffmpeg_probe.keyframe_args(frame_rate, bool(output.low_latency), output.progressive)
+    if pix_fmt:
+        args += ['-pix_fmt', pix_fmt]
+    if output.is_image_sequence:
+        args += ['-start_number', f'{start_number}']
+    args += _muxer_args(output)
+
+    return args + [str(output.output_path)]
+
+
+def _muxer_args(output: OutputConfig) -> list[str]:
+    if not output.is_stream:
+        args = ['-f', output.output_format] if output.output_format else []
+        if output.progressive:
+            args += ffmpeg_probe.progressive_args(output.output_path.suffix)
+        return args
+
+    protocol = stream_protocol(output)
+    output_format = output.output_format or STREAM_FORMATS[protocol]
+    args = ['-f', output_format, '-flush_packets', '1']
+    if output_format in ("mp4", "mov"):
+        # Fragmented MP4, receivers play it without the final moov atom.
+        args += ['-movflags', 'frag_keyframe+empty_moov+default_base_moof']
+    else:
+        args += ['-muxdelay', '0']
+    if protocol == "http":
+        # ffmpeg serves the stream itself, the capture waits for a receiver to connect.
+        args += ['-listen', '1']
+
+    return args
+
+
+def stream_protocol(output: OutputConfig) -> str | None:
+    return output.output_path.split("://", 1)[0].lower() if output.is_stream else None
+
+
+def stream_receiver(url: str, output_path: str | Path | None = None) -> subprocess.Popen:
+    # Localhost receiver for a streamed capture, stores the stream as is or discards it.
+    # Start it before the capture for udp/tcp, after it started for http.
+    ffmpeg_path = get_ffmpeg_path()
+    protocol = url.split("://", 1)[0].lower()
+    if protocol == "tcp" and "listen" not in url:
+        url += ("&" if "?" in url else "?") + "listen=1"
 
-    return subprocess.Popen(proc_cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    proc_cmd = [str(ffmpeg_path),
+                '-y',
+                '-hide_banner',
+                '-nostats',
+                '-loglevel', 'error',
+                '-i', url,
+                '-c', 'copy']
+    proc_cmd += [str(output_path)] if output_path else ['-f', 'null', '-']
+
+    return subprocess.Popen(proc_cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+
+def ffmpeg_concat(segments: list[Path], output_path: str | Path) -> subprocess.CompletedProcess:
+    ffmpeg_path = get_ffmpeg_path()
+    output_path = Path(output_path)
+
+    # Concat demuxer playlist, single quotes escaped as documented by ffmpeg.
+    list_path = output_path.parent / f"{output_path.stem}_concat.txt"
+    lines = ["file '{}'".format(str(x.resolve()).replace("'", "'\\''")) for x in segments]
+    list_path.write_text("\n".join(lines), encoding="utf-8")
+
+    proc_cmd = [str(ffmpeg_path),
+                '-y',
+                '-f', 'concat',
+                '-safe', '0',
+                '-i', str(list_path),
+                '-c', 'copy',
+                str(output_path)]
+
+    try:
+        result = subprocess.run(proc_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    finally:
+        list_path.unlink(missing_ok=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg concat failed !\n\t{result.stderr.decode(errors='replace')}")
+
+    return result
+
+
+def mayapy_script(script_path: str | Path, args: list[str], log_path: str | Path | None = None) -> subprocess.Popen:
+    mayapy_path = io_utils.get_mayapy()
+    if not mayapy_path.exists():
+        raise RuntimeError(f"mayapy not found at {mayapy_path}.")
+
+    output = open(log_path, "w") if log_path else subprocess.DEVNULL
+    try:
+        return subprocess.Popen([str(mayapy_path), str(script_path), *args],
+                                stdout=output, stderr=subprocess.STDOUT)
+    finally:
+        if log_path:
+            output.close()
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List
+from typing import Dict, List
 
 try:
     from PySide2 import QtWidgets
@@ -8,7 +8,19 @@ except:
     from PySide6 import QtWidgets
     from shiboken6 import wrapInstance, getCppPointer
 
-from maya import cmds, OpenMayaUI as omui
+from maya import cmds, mel, OpenMaya as om, OpenMayaUI as omui
+
+from ..core import constants
+
+
+# View widget pointer -> model editor, filled lazily and pruned when editors are deleted.
+_EDITOR_CACHE: Dict[int, str] = {}
+_EDITOR_CALLBACKS: Dict[str, int] = {}
+# Offscreen model panel reused by consecutive captures.
+_CAPTURE_PANEL: str | None = None
+
+# Display settings copied from the source editor to the capture panel.
+_EDITOR_DISPLAY = ("displayAppearance", "displayTextures", "displayLights", "wireframeOnShaded")
 
 
 class PanelWidget(QtWidgets.QWidget):
@@ -38,6 +50,54 @@ def create_panel(width: int, height: int) -> PanelWidget:
     return widget
 
 
+def get_capture_panel(width: int, height: int) -> str:
+    global _CAPTURE_PANEL
+
+    window = constants.CAPTURE_WINDOW_NAME
+    if _CAPTURE_PANEL is None or not cmds.modelPanel(_CAPTURE_PANEL, query=True, exists=True):
+        if cmds.window(window, exists=True):
+            cmds.deleteUI(window, window=True)
+        cmds.window(window, title="Playblast Capture", sizeable=False)
+        layout = cmds.paneLayout(parent=window)
+        _CAPTURE_PANEL = cmds.modelPanel(parent=layout,
+                                         menuBarVisible=False,
+                                         menuBarRepeatLast=False)
+        icon_bar = find_window(window, PanelWidget).findChild(QtWidgets.QWidget, "modelEditorIconBar")
+        if icon_bar is not None:
+            icon_bar.hide()
+        cmds.showWindow(window)
+
+    # Fixed editor size, the window sits outside every screen so any resolution fits.
+    editor = find_control(cmds.modelPanel(_CAPTURE_PANEL, query=True, modelEditor=True))
+    if editor is not None:
+        editor.setFixedSize(width, height)
+    cmds.window(window, edit=True, widthHeight=(width, height), topLeftCorner=(-height - 1000, -width - 1000))
+    QtWidgets.QApplication.processEvents()
+
+    return _CAPTURE_PANEL
+
+
+def delete_capture_panel():
+    global _CAPTURE_PANEL
+
+    if cmds.window(constants.CAPTURE_WINDOW_NAME, exists=True):
+        cmds.deleteUI(constants.CAPTURE_WINDOW_NAME, window=True)
+    if _CAPTURE_PANEL and cmds.modelPanel(_CAPTURE_PANEL, query=True, exists=True):
+        cmds.deleteUI(_CAPTURE_PANEL, panel=True)
+    _CAPTURE_PANEL = None
+
+
+def match_editor(source: str, panel: str, camera: str):
+    cmds.modelPanel(panel, edit=True, camera=camera)
+    editor = cmds.modelPanel(panel, query=True, modelEditor=True)
+    for name in _EDITOR_DISPLAY:
+        try:
+            value = cmds.modelEditor(source, query=True, **{name: True})
+            cmds.modelEditor(editor, edit=True, **{name: value})
+        except RuntimeError:
+            pass
+
+
 def get_panels() -> List[str]:
     return cmds.getPanel(type="modelPanel")
 
@@ -66,6 +126,25 @@ def find_window(name: str, custom_widget: QtWidgets.QWidget) -> QtWidgets.QWidge
     return get_widget(ptr, custom_widget) if ptr else None
 
 
+def get_global_controls() -> List[QtWidgets.QWidget]:
+    # Time slider and channel box, redrawn on every time change.
+    widgets = []
+    for variable in ("$gPlayBackSlider", "$gChannelBoxName"):
+        try:
+            name = mel.eval(f"$tmp = {variable}")
+        except RuntimeError:
+            continue
+        widget = find_control(name) if name else None
+        if widget is not None:
+            widgets.append(widget)
+
+    return widgets
+
+
+def get_model_editors() -> List[str]:
+    return [cmds.modelPanel(x, query=True, modelEditor=True) for x in get_panels() or []]
+
+
 def get_active_view() -> omui.M3dView:
     return omui.M3dView.active3dView()
 
@@ -76,6 +155,48 @@ def get_active_editor() -> str | None:
 
 
 def get_editor_from_view(view: omui.M3dView) -> str | None:
+    view_ptr = int(view.widget())
+    editor = _EDITOR_CACHE.get(view_ptr)
+    # Widget pointers can be reused by Qt, make sure the editor is still alive.
+    if editor and cmds.modelEditor(editor, exists=True):
+        return editor
+
+    editor = _find_editor_from_view(view)
+    if editor:
+        _EDITOR_CACHE[view_ptr] = editor
+        _watch_editor(editor)
+    else:
+        _EDITOR_CACHE.pop(view_ptr, None)
+
+    return editor
+
+
+def clear_editor_cache():
+    for callback_id in _EDITOR_CALLBACKS.values():
+        try:
+            om.MMessage.removeCallback(callback_id)
+        except RuntimeError:
+            pass
+    _EDITOR_CALLBACKS.clear()
+    _EDITOR_CACHE.clear()
+
+
+def _watch_editor(editor: str):
+    if editor in _EDITOR_CALLBACKS:
+        return
+    try:
+        _EDITOR_CALLBACKS[editor] = om.MUiMessage.addUiDeletedCallback(editor, _on_editor_deleted, editor)
+    except RuntimeError:
+        pass
+
+
+def _on_editor_deleted(editor: str):
+    _EDITOR_CALLBACKS.pop(editor, None)
+    for view_ptr in [k for k, v in _EDITOR_CACHE.items() if v == editor]:
+        del _EDITOR_CACHE[view_ptr]
+
+
+def _find_editor_from_view(view: omui.M3dView) -> str | None:
     # Get panel pointers
     panel_ptrs = {}
     for panel in get_panels():
@@ -94,6 +215,13 @@ def get_editor_from_view(view: omui.M3dView) -> str | None:
     return None
 
 
+def get_view_camera(view: omui.M3dView) -> str:
+    path = om.MDagPath()
+    view.getCamera(path)
+
+    return path.fullPathName()
+
+
 def get_view(panel: str) -> omui.M3dView:
     view = omui.M3dView()
     omui.M3dView.getM3dViewFromModelPanel(panel, view)
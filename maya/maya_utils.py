@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import List
 
 from maya import cmds, OpenMaya as om
@@ -13,8 +14,45 @@ def create_image() -> om.MImage:
     return om.MImage()
 
 
-def current_time(current) -> int:
-    return cmds.currentTime(current)
+def current_time(current, update: bool = True) -> int:
+    return cmds.currentTime(current, update=update)
+
+
+def is_undo_enabled() -> bool:
+    return cmds.undoInfo(query=True, state=True)
+
+
+def enable_undo(enable: bool):
+    # Keep the existing undo queue, only stop recording.
+    cmds.undoInfo(stateWithoutFlush=enable)
+
+
+def get_evaluation_mode() -> str:
+    return cmds.evaluationManager(query=True, mode=True)[0]
+
+
+def set_evaluation_mode(mode: str):
+    cmds.evaluationManager(mode=mode)
+
+
+def is_evaluator_enabled(name: str) -> bool:
+    value = cmds.evaluator(name=name, query=True, enable=True)
+    return bool(value[0] if isinstance(value, (list, tuple)) else value)
+
+
+def enable_evaluator(name: str, enable: bool):
+    cmds.evaluator(name=name, enable=enable)
+
+
+def fill_playback_cache(start_frame: int, end_frame: int, timeout: float = 600.0):
+    # Cached playback fills the playback range, narrow it to the capture range while waiting.
+    min_time = cmds.playbackOptions(query=True, minTime=True)
+    max_time = cmds.playbackOptions(query=True, maxTime=True)
+    cmds.playbackOptions(minTime=start_frame, maxTime=end_frame)
+    try:
+        cmds.cacheEvaluator(waitForCache=timeout)
+    finally:
+        cmds.playbackOptions(minTime=min_time, maxTime=max_time)
 
 
 def get_animation_end() -> int:
@@ -29,6 +67,27 @@ def get_frame_rate() -> int:
     return int(om.MTime(1.0, om.MTime.kSeconds).asUnits(om.MTime.uiUnit()))
 
 
+def get_loaded_references() -> List[str]:
+    # Reference nodes include nested references, unlike file -query -reference.
+    paths = []
+    for node in cmds.ls(type="reference") or []:
+        try:
+            if cmds.referenceQuery(node, isLoaded=True):
+                paths.append(cmds.referenceQuery(node, filename=True, withoutCopyNumber=True))
+        except RuntimeError:
+            # sharedReferenceNode and unassociated reference nodes.
+            continue
+
+    return sorted(set(paths))
+
+
+def get_scene_files() -> List[tuple]:
+    # Saved scene and loaded references with their mtimes, None for a missing file.
+    scene_path = cmds.file(query=True, sceneName=True)
+    paths = ([scene_path] if scene_path else []) + get_loaded_references()
+    return [(x, Path(x).stat().st_mtime_ns if Path(x).exists() else None) for x in paths]
+
+
 def get_cameras() -> List[str]:
     cameras = cmds.ls(type="camera", long=True)
     if not cameras:
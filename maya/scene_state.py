@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import ctypes
+import hashlib
+import struct
+
+from maya import OpenMaya as om
+
+
+def _get_dag_path(name: str) -> om.MDagPath | None:
+    selection = om.MSelectionList()
+    try:
+        selection.add(name)
+    except RuntimeError:
+        return None
+    path = om.MDagPath()
+    selection.getDagPath(0, path)
+
+    return path
+
+
+def _matrix_bytes(matrix: om.MMatrix) -> bytes:
+    return struct.pack("16d", *[matrix(row, col) for row in range(4) for col in range(4)])
+
+
+def _update_camera(digest, camera: str) -> None:
+    path = _get_dag_path(camera)
+    if path is None:
+        digest.update(camera.encode())
+        return
+
+    digest.update(_matrix_bytes(path.inclusiveMatrix()))
+    if path.apiType() != om.MFn.kCamera:
+        path.extendToShape()
+    fn_camera = om.MFnCamera(path)
+    digest.update(struct.pack("5d?",
+                              fn_camera.focalLength(),
+                              fn_camera.horizontalFilmAperture(),
+                              fn_camera.verticalFilmAperture(),
+                              fn_camera.orthoWidth(),
+                              fn_camera.nearClippingPlane(),
+                              fn_camera.isOrtho()))
+
+
+def _update_mesh(digest, path: om.MDagPath) -> None:
+    fn_mesh = om.MFnMesh(path)
+    count = fn_mesh.numVertices()
+    if count:
+        # Raw float3 positions of the evaluated (deformed) mesh.
+        digest.update(ctypes.string_at(int(fn_mesh.getRawPoints()), count * 3 * 4))
+
+
+def _update_points(digest, points: om.MPointArray) -> None:
+    count = points.length()
+    if count:
+        digest.update(struct.pack(f"{count * 3}d", *[v for i in range(count)
+                                                      for v in (points[i].x, points[i].y, points[i].z)]))
+
+
+def _update_nurbs(digest, path: om.MDagPath) -> None:
+    # Evaluated CVs, deformers on curves and surfaces do not show in the matrix.
+    points = om.MPointArray()
+    if path.hasFn(om.MFn.kNurbsCurve):
+        om.MFnNurbsCurve(path).getCVs(points, om.MSpace.kObject)
+    else:
+        om.MFnNurbsSurface(path).getCVs(points, om.MSpace.kObject)
+    _update_points(digest, points)
+
+
+def frame_state_hash(camera: str) -> str:
+    # Geometry and transforms only, shading, lights and render settings are not part of the hash.
+    digest = hashlib.blake2b(digest_size=16)
+    _update_camera(digest, camera)
+
+    it = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kShape)
+    while not it.isDone():
+        path = om.MDagPath()
+        it.getPath(path)
+        if path.isVisible() and not om.MFnDagNode(path).isIntermediateObject():
+            digest.update(path.fullPathName().encode())
+            digest.update(_matrix_bytes(path.inclusiveMatrix()))
+            if path.hasFn(om.MFn.kMesh):
+                _update_mesh(digest, path)
+            elif path.hasFn(om.MFn.kNurbsCurve) or path.hasFn(om.MFn.kNurbsSurface):
+                _update_nurbs(digest, path)
+        it.next()
+
+    return digest.hexdigest()
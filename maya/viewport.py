@@ -3,7 +3,7 @@ import copy
 from dataclasses import dataclass, field
 from typing import Dict, List
 
-from maya import cmds
+from maya import cmds, mel
 
 from ..core.logger import log
 from ..maya import maya_ui
@@ -57,17 +57,17 @@ class ViewportFlags:
         flag = self.get(name)
         flag.value = value
     
+    @property
+    def as_dict(self) -> Dict[str, bool]:
+        return {f.name: f.value for f in self.flags}
+
     def copy(self) -> ViewportFlags:
         new_flags = copy.deepcopy(self.flags)
         return ViewportFlags(flags=new_flags)
 
     def snapshot(self, panel: str) -> ViewportFlags:
-        result = []
-        for flag in self.flags:
-            try:
-                result.append(ViewportFlag(flag.name, flag.viewport_state(panel), flag.keep_visible))
-            except Exception as e:
-                log.error(f"Error getting state of {flag.name} !", e)
+        states = query_viewport_states(panel, [f.name for f in self.flags])
+        result = [ViewportFlag(f.name, states[f.name], f.keep_visible) for f in self.flags if f.name in states]
 
         return ViewportFlags(flags=result)
 
@@ -119,6 +119,41 @@ def set_viewport_state(panel: str, state: ViewportFlag):
         log.error(f"Error on set flag {state.name} !\n\t{e}")
 
 
-def set_viewport_states(panel: str, states: List[ViewportFlag] | ViewportFlags):
+def query_viewport_states(panel: str, names: List[str]) -> Dict[str, bool]:
+    # A single MEL evaluation instead of one modelEditor query per flag.
+    queries = ", ".join(f'`modelEditor -query -{name} "{panel}"`' for name in names)
+    try:
+        values = mel.eval(f"int $playblastFlagStates[] = {{{queries}}}; $playblastFlagStates;")
+        if len(values) == len(names):
+            return {name: bool(value) for name, value in zip(names, values)}
+    except Exception as e:
+        log.debug(f"Batched flag query failed, query flags one by one.\n\t{e}")
+
+    output = {}
+    for name in names:
+        try:
+            output[name] = bool(cmds.modelEditor(panel, query=True, **{name: True}))
+        except Exception as e:
+            log.error(f"Error getting state of {name} !\n\t{e}")
+
+    return output
+
+
+def set_viewport_states(panel: str, states: List[ViewportFlag] | ViewportFlags,
+                        current: Dict[str, bool] | ViewportFlags | None = None):
+    if isinstance(current, ViewportFlags):
+        current = current.as_dict
+    changed = {s.name: s.value for s in states if current is None or current.get(s.name) != s.value}
+    if not changed:
+        return
+
+    # One edit call, so the viewport refreshes once.
+    try:
+        cmds.modelEditor(panel, edit=True, **changed)
+        return
+    except Exception as e:
+        log.debug(f"Batched flag edit failed, set flags one by one.\n\t{e}")
+
     for state in states:
-        set_viewport_state(panel, state)
+        if state.name in changed:
+            set_viewport_state(panel, state)
@@ -13,6 +13,7 @@ from ..core.constants import MUXERS, VIDEO_ENCODERS, CLOSE_ICON_PATH, SETTINGS_I
 from ..core.settings import Settings
 from ..io import io_utils, launchers
 from ..maya import maya_ui, maya_utils
+from ..capture.async_capture import AsyncCapture
 from ..capture.config import CaptureConfig
 from ..capture.frame_capture import FrameCapture
 from ..ui.frameless_window import FramelessWindow
@@ -70,11 +71,14 @@ class PlayblastDialog(FramelessWindow):
 
         self._drag_pos = None
         self._settings = Settings()
+        self._async_capture: AsyncCapture | None = None
         
         self._build_ui()
         self.setStyleSheet(self.STYLE)
     
     def closeEvent(self, event):
+        if self._async_capture and self._async_capture.running:
+            self._async_capture.cancel()
         self._save_settings()
         super().closeEvent(event)
 
@@ -90,6 +94,11 @@ class PlayblastDialog(FramelessWindow):
         self._main_layout.addStretch()
         self._main_layout.addWidget(Separator("", parent=self))
 
+        self._progress_bar = QtWidgets.QProgressBar(self)
+        self._progress_bar.setTextVisible(True)
+        self._progress_bar.hide()
+        self._main_layout.addWidget(self._progress_bar)
+
         self._playblast_button = QtWidgets.QPushButton("Playblast", self)
         self._playblast_button.setObjectName("playblast_button")
         self._playblast_button.setFixedHeight(50)
@@ -168,6 +177,10 @@ class PlayblastDialog(FramelessWindow):
         SettingsWidget(maya_ui.get_main_window()).show()
 
     def _on_playblast_clicked(self):
+        if self._async_capture and self._async_capture.running:
+            self._async_capture.cancel()
+            self._playblast_button.setEnabled(False)
+            return
         if not self.output_path:
             log.error("Output path is not set.")
             return
@@ -183,7 +196,27 @@ class PlayblastDialog(FramelessWindow):
         player_path = self._settings.get_player()
         if player_path:
             capture.on_capture_complete.register(launchers.open_player)
-        capture.run()
+        capture.on_progress.register(self._on_capture_progress)
+
+        self._async_capture = AsyncCapture(capture, parent=self)
+        self._async_capture.on_finished.register(self._on_capture_finished)
+        self._progress_bar.setRange(0, capture_config.frame_count)
+        self._progress_bar.setValue(0)
+        self._progress_bar.setFormat("Starting...")
+        self._progress_bar.show()
+        self._playblast_button.setText("Cancel")
+        self._async_capture.start()
+
+    def _on_capture_progress(self, current: int, total: int, fps: float, eta: float):
+        self._progress_bar.setValue(current)
+        self._progress_bar.setFormat(f"{current} / {total} — {fps:.1f} fps — {eta:.0f}s left")
+
+    def _on_capture_finished(self, cancelled: bool):
+        if cancelled:
+            log.warning("Playblast cancelled.")
+        self._progress_bar.hide()
+        self._playblast_button.setText("Playblast")
+        self._playblast_button.setEnabled(True)
     
     def _save_settings(self):
         self._path_selector.save_settings()
@@ -143,8 +143,10 @@ class ViewportVisibilityWidget(QtWidgets.QWidget):
     
     def _set_viewport_flags(self):
         panel = self.config.panel
-        for chk in self._flag_checkboxes.values():
-            chk.setChecked(chk.flag.viewport_state(panel))
+        states = viewport.query_viewport_states(panel, list(self._flag_checkboxes))
+        for name, chk in self._flag_checkboxes.items():
+            if name in states:
+                chk.setChecked(states[name])
     
     def _reset_flags(self):
         for flag in viewport.VIEWPORT_FLAGS: